@@ -54,6 +54,19 @@ except ImportError:
     PYPDF2_AVAILABLE = False
     logging.warning("PyPDF2 not available. PDF reading will be limited.")
 
+# orjson for faster JSON parsing (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _loads_json(data: str) -> Any:
+    """Parse JSON, using orjson when available (errors subclass json.JSONDecodeError)"""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -81,6 +94,20 @@ class SignatureStatus(str):
     EXPIRED = "expired"
 
 
+# Document types with a PDF generator
+SUPPORTED_DOCUMENT_TYPES = frozenset({
+    DocumentType.POLICY_APPLICATION,
+    DocumentType.CLAIM_FORM,
+    DocumentType.CONSENT_FORM
+})
+
+# Customer fields required by every document type
+BASE_REQUIRED_FIELDS = (
+    'full_name', 'date_of_birth', 'email', 'phone',
+    'street_address', 'city', 'state', 'zip_code'
+)
+
+
 # ==================== Pydantic Models ====================
 
 class CustomerInfo(BaseModel):
@@ -849,14 +876,31 @@ class DocumentFillingTool(BaseTool):
         try:
             logger.info(f"Starting document filling: {document_type}")
             
+            # Reject unsupported document types before doing any work
+            if document_type not in SUPPORTED_DOCUMENT_TYPES:
+                return f"ERROR: Document filling failed - Unsupported document type: {document_type}"
+            
             # Parse customer data
-            customer_data_dict = json.loads(customer_data_json)
+            customer_data_dict = _loads_json(customer_data_json)
+            
+            # Report missing base fields without running model validation
+            missing_fields = [
+                field for field in BASE_REQUIRED_FIELDS
+                if not customer_data_dict.get(field)
+            ]
+            if missing_fields:
+                return self._format_validation_error({
+                    'missing_fields': missing_fields,
+                    'filled_required': len(BASE_REQUIRED_FIELDS) - len(missing_fields),
+                    'total_required': len(BASE_REQUIRED_FIELDS)
+                })
+            
             customer = CustomerInfo(**customer_data_dict)
             
             # Parse policy data if provided
             policy = None
             if policy_data_json:
-                policy_data_dict = json.loads(policy_data_json)
+                policy_data_dict = _loads_json(policy_data_json)
                 policy = PolicyDetails(**policy_data_dict)
             
             # Map fields
@@ -941,8 +985,7 @@ class DocumentFillingTool(BaseTool):
     
     def _get_required_fields(self, document_type: str) -> List[str]:
         """Get required fields for document type"""
-        base_fields = ['full_name', 'date_of_birth', 'email', 'phone', 
-                      'street_address', 'city', 'state', 'zip_code']
+        base_fields = list(BASE_REQUIRED_FIELDS)
         
         if document_type == "policy_application":
             return base_fields + ['insurance_type', 'coverage_amount', 'premium_amount']
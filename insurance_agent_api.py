@@ -12,16 +12,20 @@ Features:
 """
 
 import os
-import json
+import queue
+import contextlib
+import asyncio
 import logging
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, AsyncIterator
 from datetime import datetime
 
 from fastapi import FastAPI, HTTPException, Depends, Security, status
 from fastapi.security import APIKeyHeader
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
+import numpy as np
+import orjson
 import uvicorn
 
 from langchain.agents import AgentType, initialize_agent
@@ -29,9 +33,12 @@ from langchain.memory import ConversationBufferMemory
 from langchain_openai import ChatOpenAI
 
 # Import custom tools
-from quoting_tool import QuotingTool
-from underwriting_tool import UnderwritingTool
-from document_filling_tool import DocumentFillingTool
+from quoting_tool import QuotingTool, InsuranceAPIClient, CustomerData, PremiumCalculator
+from underwriting_tool import (
+    ApplicantData, UnderwritingMLModel, UnderwritingTool, evaluate_and_price,
+    get_ml_model, get_underwriting_tool
+)
+from document_filling_tool import DocumentFillingTool, CustomerInfo, PolicyDetails
 
 # Configure logging
 logging.basicConfig(
@@ -44,24 +51,75 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# ==================== Lifespan ====================
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build shared tools and the agent pool once per worker, then warm caches"""
+    logger.info("Starting Insurance AI Agent API...")
+    
+    app.state.quoting_tool = QuotingTool()
+    app.state.underwriting_tool = get_underwriting_tool()
+    app.state.document_tool = DocumentFillingTool()
+    app.state.agent_pool = AgentPool(AGENT_PARALLELISM)
+    
+    logger.info(f"API Keys configured: {len(VALID_API_KEYS)}")
+    logger.info(
+        f"Agent available: {app.state.agent_pool.available} "
+        f"(pool size: {app.state.agent_pool.size})"
+    )
+    
+    if os.getenv("SKIP_WARMUP"):
+        logger.info("SKIP_WARMUP set - skipping cache warm-up")
+    else:
+        try:
+            await asyncio.to_thread(warm_up_caches)
+            logger.info("Cache warm-up complete")
+        except Exception as e:
+            logger.warning(f"Cache warm-up failed: {str(e)}")
+    
+    yield
+    
+    logger.info("Shutting down Insurance AI Agent API...")
+    await InsuranceAPIClient.close()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Insurance AI Agent API",
     description="Automated insurance processing with AI-powered tools",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+# Explicit origins (comma-separated CORS_ORIGINS) allow credentials; otherwise
+# fall back to a credential-less wildcard, which Starlette answers without
+# per-request origin matching. Wildcard + credentials is invalid per the CORS spec.
+CORS_ORIGINS = frozenset(
+    origin.strip() for origin in os.getenv("CORS_ORIGINS", "").split(",") if origin.strip()
 )
 
+if CORS_ORIGINS:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=sorted(CORS_ORIGINS),
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+else:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=False,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
 # API Key authentication
 API_KEY_NAME = "X-API-Key"
 api_key_header = APIKeyHeader(name=API_KEY_NAME, auto_error=False)
@@ -70,6 +128,11 @@ api_key_header = APIKeyHeader(name=API_KEY_NAME, auto_error=False)
 VALID_API_KEYS = set(os.getenv("API_KEYS", "test-key-12345,demo-key-67890").split(","))
 
 
+def dumps_json(data: Any) -> str:
+    """Serialize tool payloads and streamed events to a JSON string"""
+    return orjson.dumps(data, default=str).decode()
+
+
 # ==================== Security ====================
 
 async def get_api_key(api_key: str = Security(api_key_header)):
@@ -208,38 +271,28 @@ class APIResponse(BaseModel):
 # ==================== Agent Initialization ====================
 
 class InsuranceAgentManager:
-    """Manage Insurance AI Agent instances"""
-    
-    _instance = None
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+    """Manage a single Insurance AI Agent instance and its memory"""
     
     def __init__(self):
-        if self._initialized:
-            return
-        
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
         if not self.openai_api_key:
             logger.warning("OPENAI_API_KEY not set. Agent will not be available.")
             self.agent = None
-            self._initialized = True
+            self.memory = None
             return
         
         # Initialize LLM
         self.llm = ChatOpenAI(
             model="gpt-4",
             temperature=0.2,
-            openai_api_key=self.openai_api_key
+            openai_api_key=self.openai_api_key,
+            streaming=True
         )
         
         # Initialize tools
         self.tools = [
             QuotingTool(),
-            UnderwritingTool(),
+            get_underwriting_tool(),
             DocumentFillingTool()
         ]
         
@@ -261,7 +314,6 @@ class InsuranceAgentManager:
             max_iterations=5
         )
         
-        self._initialized = True
         logger.info("Insurance Agent initialized successfully")
     
     def run_agent(self, query: str) -> Dict[str, Any]:
@@ -286,14 +338,88 @@ class InsuranceAgentManager:
                 "error": str(e)
             }
     
+    async def stream_agent(self, query: str) -> AsyncIterator[Dict[str, Any]]:
+        """Stream LLM tokens, tool calls and the final answer for query"""
+        if not self.agent:
+            raise HTTPException(
+                status_code=503,
+                detail="Agent not available. OPENAI_API_KEY not configured."
+            )
+        
+        async for event in self.agent.astream_events({"input": query}, version="v1"):
+            kind = event["event"]
+            if kind == "on_chat_model_stream":
+                content = event["data"]["chunk"].content
+                if content:
+                    yield {"type": "token", "content": content}
+            elif kind == "on_tool_start":
+                yield {"type": "tool_start", "tool": event["name"], "input": event["data"].get("input")}
+            elif kind == "on_tool_end":
+                yield {"type": "tool_end", "tool": event["name"], "output": str(event["data"].get("output", ""))}
+            elif kind == "on_chain_end" and event["name"] == "AgentExecutor":
+                output = event["data"].get("output") or {}
+                yield {"type": "final", "output": output.get("output", "")}
+    
     def clear_memory(self):
         """Clear agent memory"""
         if self.memory:
             self.memory.clear()
 
 
-# Initialize agent manager
-agent_manager = InsuranceAgentManager()
+class AgentPool:
+    """
+    Bounded pool of InsuranceAgentManager instances
+    
+    Every manager owns its own agent and conversation memory, so concurrent
+    requests never share agent state. Blocking agent calls run in a worker
+    thread while a semaphore caps how many are in flight at once.
+    """
+    
+    def __init__(self, size: int):
+        first = InsuranceAgentManager()
+        if first.agent is None:
+            # Without an API key every manager would be an identical stub
+            size = 1
+        
+        self.size = size
+        self._managers = [first] + [InsuranceAgentManager() for _ in range(size - 1)]
+        self._idle: queue.Queue = queue.Queue()
+        for manager in self._managers:
+            self._idle.put(manager)
+        self._semaphore = asyncio.Semaphore(size)
+    
+    @property
+    def available(self) -> bool:
+        """Whether the agents are configured"""
+        return self._managers[0].agent is not None
+    
+    async def run_agent(self, query: str) -> Dict[str, Any]:
+        """Run query on an idle agent without blocking the event loop"""
+        async with self._semaphore:
+            manager = self._idle.get_nowait()
+            try:
+                return await asyncio.to_thread(manager.run_agent, query)
+            finally:
+                self._idle.put(manager)
+    
+    async def stream_agent(self, query: str) -> AsyncIterator[Dict[str, Any]]:
+        """Stream agent events for query, holding an idle agent until done"""
+        async with self._semaphore:
+            manager = self._idle.get_nowait()
+            try:
+                async for event in manager.stream_agent(query):
+                    yield event
+            finally:
+                self._idle.put(manager)
+    
+    def clear_memory(self):
+        """Clear memory of every agent in the pool"""
+        for manager in self._managers:
+            manager.clear_memory()
+
+
+# Agent pool size (the pool itself is built in lifespan)
+AGENT_PARALLELISM = int(os.getenv("AGENT_PARALLELISM", "4"))
 
 
 # ==================== API Endpoints ====================
@@ -322,7 +448,7 @@ async def health_check():
     return {
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
-        "agent_available": agent_manager.agent is not None,
+        "agent_available": app.state.agent_pool.available,
         "tools": {
             "quoting": "available",
             "underwriting": "available",
@@ -346,8 +472,8 @@ async def generate_quote(
     try:
         logger.info(f"Quote request: {request_id}")
         
-        tool = QuotingTool()
-        result = tool._run(json.dumps(request.customer_data))
+        tool = app.state.quoting_tool
+        result = await tool._arun(dumps_json(request.customer_data))
         
         return APIResponse(
             success=True,
@@ -380,8 +506,8 @@ async def perform_underwriting(
     try:
         logger.info(f"Underwriting request: {request_id}")
         
-        tool = UnderwritingTool()
-        result = tool._run(json.dumps(request.applicant_data))
+        tool = app.state.underwriting_tool
+        result = await tool._arun(dumps_json(request.applicant_data))
         
         return APIResponse(
             success=True,
@@ -414,11 +540,11 @@ async def fill_document(
     try:
         logger.info(f"Document request: {request_id}")
         
-        tool = DocumentFillingTool()
+        tool = app.state.document_tool
         result = tool._run(
-            json.dumps(request.customer_data),
+            dumps_json(request.customer_data),
             request.document_type,
-            json.dumps(request.policy_data) if request.policy_data else None,
+            dumps_json(request.policy_data) if request.policy_data else None,
             request.request_signature
         )
         
@@ -438,22 +564,51 @@ async def fill_document(
         )
 
 
+async def agent_event_stream(query: str, request_id: str) -> AsyncIterator[str]:
+    """Format agent events as server-sent events"""
+    try:
+        async for event in app.state.agent_pool.stream_agent(query):
+            event["request_id"] = request_id
+            yield f"data: {dumps_json(event)}\n\n"
+    except Exception as e:
+        logger.error(f"Agent streaming error: {str(e)}", exc_info=True)
+        yield f"data: {dumps_json({'type': 'error', 'error': str(e), 'request_id': request_id})}\n\n"
+    
+    yield f"data: {dumps_json({'type': 'done', 'request_id': request_id})}\n\n"
+
+
 @app.post("/api/v1/agent", response_model=APIResponse)
 async def run_agent(
     request: AgentRequest,
+    stream: bool = False,
     api_key: str = Depends(get_api_key)
 ):
     """
     Run AI agent with natural language query
     
+    Pass ?stream=true to receive tokens, tool calls and the final answer
+    as server-sent events while the agent is still working.
+    
     Requires valid API key in X-API-Key header
     """
     request_id = f"AG-{datetime.now().strftime('%Y%m%d%H%M%S')}"
     
+    if stream:
+        if not app.state.agent_pool.available:
+            raise HTTPException(
+                status_code=503,
+                detail="Agent not available. OPENAI_API_KEY not configured."
+            )
+        logger.info(f"Agent stream request: {request_id}")
+        return StreamingResponse(
+            agent_event_stream(request.query, request_id),
+            media_type="text/event-stream"
+        )
+    
     try:
         logger.info(f"Agent request: {request_id}")
         
-        result = agent_manager.run_agent(request.query)
+        result = await app.state.agent_pool.run_agent(request.query)
         
         if not result.get("success"):
             raise HTTPException(
@@ -483,7 +638,7 @@ async def run_agent(
 async def clear_agent_memory(api_key: str = Depends(get_api_key)):
     """Clear agent conversation memory"""
     try:
-        agent_manager.clear_memory()
+        app.state.agent_pool.clear_memory()
         return {
             "success": True,
             "message": "Memory cleared successfully",
@@ -536,7 +691,7 @@ async def download_document(
 async def global_exception_handler(request, exc):
     """Global exception handler"""
     logger.error(f"Unhandled exception: {str(exc)}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "success": False,
@@ -547,20 +702,40 @@ async def global_exception_handler(request, exc):
     )
 
 
-# ==================== Startup/Shutdown ====================
-
-@app.on_event("startup")
-async def startup_event():
-    """Startup event"""
-    logger.info("Starting Insurance AI Agent API...")
-    logger.info(f"API Keys configured: {len(VALID_API_KEYS)}")
-    logger.info(f"Agent available: {agent_manager.agent is not None}")
-
+# ==================== Warm-up ====================
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Shutdown event"""
-    logger.info("Shutting down Insurance AI Agent API...")
+def warm_up_caches():
+    """
+    Prime lazily-built caches so the first user request doesn't pay for them
+    
+    Builds the pydantic-core validators/JSON schemas for the request models,
+    then runs the pure pricing, ML and rule functions on the documented example
+    payloads: this loads the underwriting ML model and compiles the Numba batch
+    kernels with batches large enough to take the JIT paths. The tools' _run
+    methods are not called, since they submit quotes, log and hash PII.
+    """
+    for model in (QuoteRequest, UnderwritingRequest, DocumentRequest, AgentRequest, APIResponse):
+        model.model_json_schema()
+    
+    quote_example = QuoteRequest.model_config["json_schema_extra"]["example"]
+    customer = CustomerData(**quote_example["customer_data"])
+    PremiumCalculator.calculate_auto_insurance(customer)
+    encoded = PremiumCalculator.encode_auto_batch([customer])
+    PremiumCalculator.calculate_auto_batch(**{
+        name: np.repeat(column, PremiumCalculator.NUMBA_MIN_BATCH)
+        for name, column in encoded.items()
+    })
+    
+    underwriting_example = UnderwritingRequest.model_config["json_schema_extra"]["example"]
+    applicant = ApplicantData(**underwriting_example["applicant_data"])
+    ml_model = get_ml_model()
+    features = UnderwritingTool._ml_features(applicant)
+    ml_model.predict_risk_batch([features] * UnderwritingMLModel.NUMBA_MIN_BATCH)
+    evaluate_and_price(applicant, {}, ml_model.predict_risk(features))
+    
+    document_example = DocumentRequest.model_config["json_schema_extra"]["example"]
+    CustomerInfo(**document_example["customer_data"])
+    PolicyDetails(**document_example["policy_data"])
 
 
 # ==================== Main ====================
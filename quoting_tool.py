@@ -14,6 +14,12 @@ import sys
 import json
 import logging
 import asyncio
+import atexit
+import functools
+import concurrent.futures
+import itertools
+import importlib.util
+from bisect import bisect_left
 
 # Set UTF-8 encoding for Windows console
 if sys.platform == "win32":
@@ -22,16 +28,42 @@ if sys.platform == "win32":
     except AttributeError:
         import codecs
         sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
-from typing import Optional, Type, Dict, Any, Literal
-from datetime import datetime, timedelta
-from enum import Enum
+from typing import Optional, Type, Dict, Any, List, Literal, Tuple, Callable
+from datetime import date, datetime, timedelta
+from enum import Enum, IntEnum
 
-import requests
+import numpy as np
 from langchain.tools import BaseTool
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation, ValidationError, field_validator, model_validator
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# aiohttp for non-blocking calls to the external API
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# orjson for fast request body serialization (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Numba JIT for batch repricing (optional). Only probed here: numba is
+# imported when the first large batch is priced, so single quotes and
+# cold starts skip the import cost
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+
+def _dumps_json(data: Any) -> bytes:
+    """Serialize data to JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC)
+    return json.dumps(data, default=str).encode("utf-8")
+
+
+# Logging is configured by the application (see example_usage for standalone runs)
 logger = logging.getLogger(__name__)
 
 
@@ -41,6 +73,10 @@ class InsuranceType(str, Enum):
     """Supported insurance types"""
     AUTO = "auto"
     HEALTH = "health"
+    
+    def __init__(self, value: str):
+        # Display form used in quote IDs and reports, computed once per member
+        self.upper_value = value.upper()
 
 
 class Gender(str, Enum):
@@ -57,10 +93,25 @@ class LocationType(str, Enum):
     RURAL = "rural"
 
 
+class ExerciseFrequency(IntEnum):
+    """Exercise frequency codes used for rate table indexing"""
+    NONE = 0
+    OCCASIONAL = 1
+    REGULAR = 2
+    FREQUENT = 3
+
+
 # ==================== Pydantic Models ====================
 
+# Request/result models are immutable once validated; surrounding whitespace
+# is stripped from all string fields during validation
+_FROZEN_MODEL_CONFIG = ConfigDict(frozen=True, str_strip_whitespace=True)
+
+
 class VehicleDetails(BaseModel):
     """Vehicle information for auto insurance"""
+    model_config = _FROZEN_MODEL_CONFIG
+    
     make: str = Field(..., description="Vehicle manufacturer (e.g., Tesla, BMW)")
     model: str = Field(..., description="Vehicle model (e.g., Model 3, X5)")
     year: int = Field(..., ge=1990, le=2026, description="Vehicle year")
@@ -73,13 +124,15 @@ class VehicleDetails(BaseModel):
     @field_validator('make', 'model')
     @classmethod
     def validate_not_empty(cls, v):
-        if not v or not v.strip():
+        if not v:
             raise ValueError("Make and model cannot be empty")
-        return v.strip()
+        return v
 
 
 class HealthDetails(BaseModel):
     """Health information for health insurance"""
+    model_config = _FROZEN_MODEL_CONFIG
+    
     smoker: bool = Field(default=False, description="Whether the customer is a smoker")
     pre_existing_conditions: bool = Field(
         default=False,
@@ -94,6 +147,8 @@ class HealthDetails(BaseModel):
 
 class CustomerData(BaseModel):
     """Complete customer data for insurance quoting"""
+    model_config = _FROZEN_MODEL_CONFIG
+    
     age: int = Field(..., ge=18, le=100, description="Customer age (18-100)")
     gender: Gender = Field(..., description="Customer gender")
     address: str = Field(..., min_length=5, description="Customer address")
@@ -130,27 +185,30 @@ class CustomerData(BaseModel):
     @field_validator('address')
     @classmethod
     def validate_address(cls, v):
-        if not v or not v.strip():
+        if not v:
             raise ValueError("Address cannot be empty")
-        return v.strip()
+        return v
 
 
 class QuoteResult(BaseModel):
     """Insurance quote result"""
+    model_config = _FROZEN_MODEL_CONFIG
+    
     quote_id: str = Field(..., description="Unique quote identifier")
     customer_age: int = Field(..., description="Customer age")
     insurance_type: str = Field(..., description="Insurance type")
     base_premium: float = Field(..., description="Base premium amount")
     age_factor: float = Field(..., description="Age multiplier")
     location_factor: float = Field(..., description="Location multiplier")
-    additional_factors: Dict[str, float] = Field(
+    # Computed in-process from rate tables, so these are not re-validated
+    additional_factors: SkipValidation[Dict[str, float]] = Field(
         default_factory=dict,
         description="Additional risk factors"
     )
     total_premium: float = Field(..., description="Total monthly premium")
     annual_premium: float = Field(..., description="Total annual premium")
-    coverage_details: Dict[str, Any] = Field(..., description="Coverage information")
-    deductible: float = Field(..., description="Policy deductible")
+    coverage_details: SkipValidation[Dict[str, Any]] = Field(..., description="Coverage information")
+    deductible: SkipValidation[float] = Field(..., description="Policy deductible")
     effective_date: str = Field(..., description="Policy effective date")
     expiry_date: str = Field(..., description="Policy expiry date")
     quote_valid_until: str = Field(..., description="Quote validity date")
@@ -169,8 +227,33 @@ class QuotingToolInput(BaseModel):
     )
 
 
+def _invalid_json_details(error: ValidationError) -> Optional[str]:
+    """Return the parser message if validation failed because the input is not valid JSON"""
+    for err in error.errors():
+        if err["type"] == "json_invalid":
+            return err["msg"]
+    return None
+
+
+@functools.lru_cache(maxsize=2)
+def _quote_dates(today: date) -> Tuple[str, str, str]:
+    """Effective, expiry and quote-valid-until dates for quotes issued on a day"""
+    effective_date = today + timedelta(days=1)
+    expiry_date = effective_date + timedelta(days=365)
+    valid_until = today + timedelta(days=30)
+    return effective_date.isoformat(), expiry_date.isoformat(), valid_until.isoformat()
+
+
 # ==================== Rate Tables ====================
 
+def _build_age_factor_table(young: float, standard: float, senior: float) -> tuple:
+    """Expand young (< 25) / standard / senior (> 65) factors into a per-age table (0-100)"""
+    return tuple(
+        young if age < 25 else senior if age > 65 else standard
+        for age in range(101)
+    )
+
+
 class RateTables:
     """Pre-defined rate tables for insurance premium calculations"""
     
@@ -187,6 +270,13 @@ class RateTables:
         "senior": 1.15       # > 65 years
     }
     
+    # Age factors indexed by age, precomputed so quoting is a single lookup
+    AUTO_AGE_FACTOR = _build_age_factor_table(
+        AGE_FACTORS["young"], AGE_FACTORS["standard"], AGE_FACTORS["senior"]
+    )
+    # Younger people pay less for health insurance, seniors pay more
+    HEALTH_AGE_FACTOR = _build_age_factor_table(0.85, 1.0, 1.50)
+    
     # Location factors
     LOCATION_FACTORS = {
         LocationType.URBAN: 1.10,      # Cities - higher risk
@@ -202,6 +292,9 @@ class RateTables:
         (100000, 1.50),
         (float('inf'), 1.80)
     ]
+    # Sorted thresholds/factors for bisect lookup of the tiers above
+    VEHICLE_VALUE_THRESHOLDS = tuple(threshold for threshold, _ in VEHICLE_VALUE_TIERS)
+    VEHICLE_VALUE_FACTORS = tuple(factor for _, factor in VEHICLE_VALUE_TIERS)
     
     # Health factors (for health insurance)
     HEALTH_FACTORS = {
@@ -213,6 +306,19 @@ class RateTables:
         "exercise_frequent": 0.95
     }
     
+    # Exercise adjustments indexed by ExerciseFrequency: (factor name, factor)
+    EXERCISE_FACTORS = (
+        ("no_exercise", HEALTH_FACTORS["exercise_none"]),
+        None,
+        None,
+        ("frequent_exercise", HEALTH_FACTORS["exercise_frequent"])
+    )
+    
+    # Surcharges keyed by (gender, under 25): (factor name, factor)
+    GENDER_AGE_FACTORS = {
+        (Gender.MALE, True): ("young_male_surcharge", 1.10)
+    }
+    
     # Coverage details by insurance type
     COVERAGE_DETAILS = {
         InsuranceType.AUTO: {
@@ -236,6 +342,21 @@ class RateTables:
         InsuranceType.AUTO: 1000,
         InsuranceType.HEALTH: 2500
     }
+    
+    # Display labels for report keys, rendered once instead of per quote
+    COVERAGE_LABELS = {
+        key: key.replace('_', ' ').title()
+        for details in COVERAGE_DETAILS.values()
+        for key in details
+    }
+    FACTOR_LABELS = {
+        key: key.replace('_', ' ').title()
+        for key in (
+            "commercial_use", "new_vehicle_discount", "old_vehicle_surcharge",
+            "young_male_surcharge", "smoker", "pre_existing_conditions",
+            "high_bmi", "low_bmi", "no_exercise", "frequent_exercise"
+        )
+    }
 
 
 # ==================== External API Integration ====================
@@ -247,10 +368,28 @@ class InsuranceAPIClient:
     API_ENDPOINT = "https://api.insurance-provider.example.com/v1/quotes"
     API_TIMEOUT = 10  # seconds
     
+    # Set to False to post quotes to API_ENDPOINT
+    SIMULATE = True
+    
+    # Connection pool sizing for the shared sessions
+    POOL_CONNECTIONS = 20
+    POOL_MAXSIZE = 100
+    DNS_CACHE_TTL = 300  # seconds
+    
+    # Shared sessions (keep-alive + connection pooling). An aiohttp session is
+    # bound to the event loop that created it, so there is one per loop.
+    _session: Optional["requests.Session"] = None
+    _asessions: Dict[asyncio.AbstractEventLoop, "aiohttp.ClientSession"] = {}
+    
+    JSON_HEADERS = {"Content-Type": "application/json"}
+    
+    # Monotonic source for simulated confirmation numbers
+    _confirmation_counter = itertools.count(1)
+    
     @classmethod
     def submit_quote(cls, quote_data: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Submit quote to external API (simulated)
+        Submit quote to external API
         
         Args:
             quote_data: Quote information to submit
@@ -259,57 +398,25 @@ class InsuranceAPIClient:
             API response with confirmation
         """
         try:
-            # In production, this would be an actual API call:
-            # response = requests.post(
-            #     cls.API_ENDPOINT,
-            #     json=quote_data,
-            #     timeout=cls.API_TIMEOUT,
-            #     headers={"Authorization": "Bearer YOUR_API_KEY"}
-            # )
-            # response.raise_for_status()
-            # return response.json()
-            
-            # Simulated API response
-            logger.info(f"Simulating API call to {cls.API_ENDPOINT}")
-            
-            # Simulate network delay
-            import time
-            time.sleep(0.5)
-            
-            api_response = {
-                "status": "success",
-                "api_quote_id": f"API-{datetime.now().strftime('%Y%m%d%H%M%S')}",
-                "confirmation_number": f"CONF-{hash(str(quote_data)) % 1000000:06d}",
-                "message": "Quote submitted successfully to underwriting system",
-                "next_steps": [
-                    "Quote has been recorded in the system",
-                    "Underwriting review will be completed within 24 hours",
-                    "Customer will receive confirmation email"
-                ],
-                "timestamp": datetime.now().isoformat()
-            }
+            if not cls.SIMULATE:
+                response = cls._get_session().post(
+                    cls.API_ENDPOINT,
+                    data=_dumps_json(quote_data),
+                    headers=cls.JSON_HEADERS,
+                    timeout=cls.API_TIMEOUT
+                )
+                response.raise_for_status()
+                return orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
             
-            logger.info(f"API response received: {api_response['api_quote_id']}")
-            return api_response
+            return cls._simulate_response()
             
-        except requests.RequestException as e:
-            logger.error(f"API request failed: {str(e)}")
-            return {
-                "status": "error",
-                "error": f"Failed to connect to insurance API: {str(e)}",
-                "fallback": "Quote generated locally, manual submission required"
-            }
         except Exception as e:
-            logger.error(f"Unexpected error in API call: {str(e)}")
-            return {
-                "status": "error",
-                "error": str(e)
-            }
+            return cls._error_response(e)
     
     @classmethod
     async def submit_quote_async(cls, quote_data: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Async version of submit_quote
+        Submit quote to external API without blocking the event loop
         
         Args:
             quote_data: Quote information to submit
@@ -318,95 +425,353 @@ class InsuranceAPIClient:
             API response with confirmation
         """
         try:
-            # In production with async requests:
-            # async with aiohttp.ClientSession() as session:
-            #     async with session.post(
-            #         cls.API_ENDPOINT,
-            #         json=quote_data,
-            #         timeout=cls.API_TIMEOUT
-            #     ) as response:
-            #         return await response.json()
+            if not cls.SIMULATE:
+                if not AIOHTTP_AVAILABLE:
+                    raise RuntimeError("aiohttp is required for async API calls")
+                
+                session = await cls._get_async_session()
+                async with session.post(
+                    cls.API_ENDPOINT, data=_dumps_json(quote_data), headers=cls.JSON_HEADERS
+                ) as response:
+                    response.raise_for_status()
+                    body = await response.read()
+                    return orjson.loads(body) if ORJSON_AVAILABLE else json.loads(body)
             
-            # Simulate async operation
-            logger.info(f"Simulating async API call to {cls.API_ENDPOINT}")
-            await asyncio.sleep(0.5)  # Simulate network delay
-            
-            api_response = {
-                "status": "success",
-                "api_quote_id": f"API-ASYNC-{datetime.now().strftime('%Y%m%d%H%M%S')}",
-                "confirmation_number": f"CONF-{hash(str(quote_data)) % 1000000:06d}",
-                "message": "Quote submitted successfully (async) to underwriting system",
-                "next_steps": [
-                    "Quote has been recorded in the system",
-                    "Underwriting review will be completed within 24 hours",
-                    "Customer will receive confirmation email"
-                ],
-                "timestamp": datetime.now().isoformat()
-            }
-            
-            logger.info(f"Async API response received: {api_response['api_quote_id']}")
-            return api_response
+            await asyncio.sleep(0)  # Yield to the event loop like a real request would
+            return cls._simulate_response()
             
         except Exception as e:
-            logger.error(f"Async API call failed: {str(e)}")
-            return {
-                "status": "error",
-                "error": str(e),
-                "fallback": "Quote generated locally, manual submission required"
-            }
+            return cls._error_response(e)
+    
+    @classmethod
+    async def close(cls) -> None:
+        """Close the shared HTTP sessions (call on application shutdown)"""
+        session = cls._asessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.close()
+        await cls._close_stale_async_sessions()
+        cls._close_session()
+    
+    @classmethod
+    async def _close_stale_async_sessions(cls) -> None:
+        """Close the aiohttp sessions of event loops that have since been closed"""
+        for loop in [loop for loop in cls._asessions if loop.is_closed()]:
+            await cls._asessions.pop(loop).close()
+    
+    @classmethod
+    def _close_sessions_at_exit(cls) -> None:
+        """Close the requests session and any aiohttp sessions left by finished loops"""
+        cls._close_session()
+        if any(loop.is_closed() for loop in cls._asessions):
+            asyncio.run(cls._close_stale_async_sessions())
+    
+    @classmethod
+    def _close_session(cls) -> None:
+        """Close the shared requests session"""
+        if cls._session is not None:
+            cls._session.close()
+            cls._session = None
+    
+    @classmethod
+    def _get_session(cls) -> "requests.Session":
+        """Return the shared requests session, creating it on first use"""
+        if cls._session is None:
+            # Imported lazily: only the live sync path needs requests
+            import requests
+            from requests.adapters import HTTPAdapter
+            
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=cls.POOL_CONNECTIONS,
+                pool_maxsize=cls.POOL_MAXSIZE
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            cls._session = session
+        return cls._session
+    
+    @classmethod
+    async def _get_async_session(cls) -> "aiohttp.ClientSession":
+        """Return the shared aiohttp session for the running event loop"""
+        # A new loop usually means an earlier one (e.g. from asyncio.run) has
+        # finished; close its session rather than leave the connections open
+        await cls._close_stale_async_sessions()
+        
+        loop = asyncio.get_running_loop()
+        session = cls._asessions.get(loop)
+        if session is None or session.closed:
+            session = cls._asessions[loop] = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=cls.POOL_MAXSIZE,
+                    ttl_dns_cache=cls.DNS_CACHE_TTL
+                ),
+                timeout=aiohttp.ClientTimeout(total=cls.API_TIMEOUT)
+            )
+        return session
+    
+    @classmethod
+    def _simulate_response(cls) -> Dict[str, Any]:
+        """Build a simulated API response"""
+        logger.debug("Simulating API call to %s", cls.API_ENDPOINT)
+        
+        now = datetime.now()
+        api_response = {
+            "status": "success",
+            "api_quote_id": f"API-{now.strftime('%Y%m%d%H%M%S')}",
+            "confirmation_number": f"CONF-{next(cls._confirmation_counter) % 1000000:06d}",
+            "message": "Quote submitted successfully to underwriting system",
+            "next_steps": [
+                "Quote has been recorded in the system",
+                "Underwriting review will be completed within 24 hours",
+                "Customer will receive confirmation email"
+            ],
+            "timestamp": now.isoformat()
+        }
+        
+        logger.info("API response received: %s", api_response["api_quote_id"])
+        return api_response
+    
+    @staticmethod
+    def _error_response(error: Exception) -> Dict[str, Any]:
+        """Build the fallback response for a failed API call"""
+        logger.error("API request failed: %s", error)
+        return {
+            "status": "error",
+            "error": f"Failed to connect to insurance API: {str(error)}",
+            "fallback": "Quote generated locally, manual submission required"
+        }
+
+
+# Release pooled connections at interpreter exit
+atexit.register(InsuranceAPIClient._close_sessions_at_exit)
+
+
+# ==================== Batch Pricing ====================
+
+# Rate tables as arrays for vectorized lookups. Location and gender codes are
+# positions in the LocationType / Gender enums.
+_AUTO_BASE_RATE = RateTables.BASE_RATES[InsuranceType.AUTO]
+_AUTO_AGE_FACTOR_ARR = np.array(RateTables.AUTO_AGE_FACTOR)
+_LOCATION_FACTOR_ARR = np.array([RateTables.LOCATION_FACTORS[loc] for loc in LocationType])
+_VEHICLE_THRESHOLD_ARR = np.array(RateTables.VEHICLE_VALUE_THRESHOLDS)
+_VEHICLE_FACTOR_ARR = np.array(RateTables.VEHICLE_VALUE_FACTORS)
+_LOCATION_INDEX = {loc: i for i, loc in enumerate(LocationType)}
+_GENDER_INDEX = {gender: i for i, gender in enumerate(Gender)}
+_YOUNG_GENDER_FACTOR_ARR = np.array(
+    [RateTables.GENDER_AGE_FACTORS.get((gender, True), (None, 1.0))[1] for gender in Gender]
+)
+
+
+def _check_codes(name: str, codes: np.ndarray, size: int) -> None:
+    """Reject table indices outside 0..size-1 (the Numba kernel does not bounds-check)"""
+    if codes.size and (codes.min() < 0 or codes.max() >= size):
+        raise ValueError(f"{name} must be between 0 and {size - 1}")
+
+
+def _auto_batch_numpy(ages, values, years, loc_idx, usage_flag, gender_idx, current_year):
+    """Vectorized auto premiums (same factor order as PremiumCalculator._auto_premium)"""
+    premium = (
+        _AUTO_BASE_RATE
+        * _AUTO_AGE_FACTOR_ARR[ages]
+        * _LOCATION_FACTOR_ARR[loc_idx]
+        * _VEHICLE_FACTOR_ARR[np.searchsorted(_VEHICLE_THRESHOLD_ARR, values, side="left")]
+    )
+    premium = np.where(usage_flag, premium * 1.20, premium)
+    
+    vehicle_age = current_year - years
+    premium = np.where(vehicle_age <= 5, premium * 0.95, premium)
+    premium = np.where(vehicle_age > 15, premium * 1.10, premium)
+    
+    premium = np.where(ages < 25, premium * _YOUNG_GENDER_FACTOR_ARR[gender_idx], premium)
+    return premium
+
+
+@functools.lru_cache(maxsize=None)
+def _auto_batch_numba():
+    """Import Numba and compile the batch kernel on first use"""
+    from numba import njit, prange
+    
+    # No fastmath: reassociating the factor product shifts premiums by a cent
+    @njit(parallel=True, cache=True)
+    def auto_batch(ages, values, years, loc_idx, usage_flag, gender_idx, current_year):
+        """JIT-compiled counterpart of _auto_batch_numpy"""
+        tiers = np.searchsorted(_VEHICLE_THRESHOLD_ARR, values)
+        premiums = np.empty(ages.shape[0])
+        for i in prange(ages.shape[0]):
+            premium = (
+                _AUTO_BASE_RATE
+                * _AUTO_AGE_FACTOR_ARR[ages[i]]
+                * _LOCATION_FACTOR_ARR[loc_idx[i]]
+                * _VEHICLE_FACTOR_ARR[tiers[i]]
+            )
+            if usage_flag[i]:
+                premium *= 1.20
+            vehicle_age = current_year - years[i]
+            if vehicle_age <= 5:
+                premium *= 0.95
+            elif vehicle_age > 15:
+                premium *= 1.10
+            if ages[i] < 25:
+                premium *= _YOUNG_GENDER_FACTOR_ARR[gender_idx[i]]
+            premiums[i] = premium
+        return premiums
+    
+    return auto_batch
 
 
 # ==================== Premium Calculator ====================
 
+def _copy_calculation(calculation: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a memoized premium calculation, including its factor dicts, so callers cannot alter the cache"""
+    return {
+        key: dict(value) if isinstance(value, dict) else value
+        for key, value in calculation.items()
+    }
+
+
 class PremiumCalculator:
     """Calculate insurance premiums based on customer data and rate tables"""
     
+    # JIT the batch path only when Numba is installed and the batch is large
+    # enough to amortize compilation; single quotes stay interpreter-only
+    USE_NUMBA = NUMBA_AVAILABLE
+    NUMBA_MIN_BATCH = 1000
+    
     @staticmethod
-    def calculate_auto_insurance(customer: CustomerData) -> Dict[str, Any]:
+    def calculate_auto_batch(
+        ages: np.ndarray,
+        values: np.ndarray,
+        years: np.ndarray,
+        loc_idx: np.ndarray,
+        usage_flag: np.ndarray,
+        gender_idx: np.ndarray,
+        current_year: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Calculate monthly auto premiums for a whole portfolio at once
+        
+        Args:
+            ages: Customer ages
+            values: Vehicle values in USD
+            years: Vehicle model years
+            loc_idx: LocationType positions (see encode_auto_batch)
+            usage_flag: True for commercial use
+            gender_idx: Gender positions
+            current_year: Year used for vehicle age (defaults to now)
+            
+        Returns:
+            Monthly premiums rounded to cents
+            
+        Raises:
+            ValueError: If an age or location/gender code is outside its rate table
+        """
+        if current_year is None:
+            current_year = datetime.now().year
+        ages = np.asarray(ages, dtype=np.int64)
+        values = np.asarray(values, dtype=np.float64)
+        years = np.asarray(years, dtype=np.int64)
+        loc_idx = np.asarray(loc_idx, dtype=np.int64)
+        usage_flag = np.asarray(usage_flag, dtype=np.bool_)
+        gender_idx = np.asarray(gender_idx, dtype=np.int64)
+        _check_codes("ages", ages, _AUTO_AGE_FACTOR_ARR.shape[0])
+        _check_codes("loc_idx", loc_idx, _LOCATION_FACTOR_ARR.shape[0])
+        _check_codes("gender_idx", gender_idx, _YOUNG_GENDER_FACTOR_ARR.shape[0])
+        
+        if PremiumCalculator.USE_NUMBA and ages.shape[0] >= PremiumCalculator.NUMBA_MIN_BATCH:
+            premiums = _auto_batch_numba()(
+                ages, values, years, loc_idx, usage_flag, gender_idx, current_year
+            )
+        else:
+            premiums = _auto_batch_numpy(
+                ages, values, years, loc_idx, usage_flag, gender_idx, current_year
+            )
+        # np.round scales by 100 before rounding, which can land a cent away from
+        # the built-in round() used for single quotes (e.g. 1600.2250000000001)
+        return np.fromiter((round(p, 2) for p in premiums.tolist()), dtype=np.float64, count=premiums.shape[0])
+    
+    @staticmethod
+    def encode_auto_batch(customers: List[CustomerData]) -> Dict[str, np.ndarray]:
+        """Encode auto customers as the arrays calculate_auto_batch expects"""
+        return {
+            "ages": np.array([c.age for c in customers], dtype=np.int64),
+            "values": np.array([c.vehicle_details.value for c in customers], dtype=np.float64),
+            "years": np.array([c.vehicle_details.year for c in customers], dtype=np.int64),
+            "loc_idx": np.array([_LOCATION_INDEX[c.location_type] for c in customers], dtype=np.int64),
+            "usage_flag": np.array(
+                [c.vehicle_details.usage == "commercial" for c in customers], dtype=np.bool_
+            ),
+            "gender_idx": np.array([_GENDER_INDEX[c.gender] for c in customers], dtype=np.int64),
+        }
+    
+    @staticmethod
+    def calculate_auto_insurance(
+        customer: CustomerData,
+        current_year: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         Calculate auto insurance premium
         
         Formula: base_rate * age_factor * location_factor * vehicle_factor
+        
+        Results are memoized; every call returns a fresh copy.
         """
+        if current_year is None:
+            current_year = datetime.now().year
+        vehicle = customer.vehicle_details
+        return _copy_calculation(PremiumCalculator._auto_premium(
+            customer.age,
+            customer.gender,
+            customer.location_type,
+            vehicle.value,
+            vehicle.year,
+            vehicle.usage == "commercial",
+            current_year
+        ))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _auto_premium(
+        age: int,
+        gender: Gender,
+        location_type: LocationType,
+        vehicle_value: float,
+        vehicle_year: int,
+        commercial_use: bool,
+        current_year: int
+    ) -> Dict[str, Any]:
+        """Auto premium from primitive inputs (pure, memoized)"""
         base_premium = RateTables.BASE_RATES[InsuranceType.AUTO]
         
         # Age factor
-        if customer.age < 25:
-            age_factor = RateTables.AGE_FACTORS["young"]
-        elif customer.age > 65:
-            age_factor = RateTables.AGE_FACTORS["senior"]
-        else:
-            age_factor = RateTables.AGE_FACTORS["standard"]
+        age_factor = RateTables.AUTO_AGE_FACTOR[age]
         
         # Location factor
-        location_factor = RateTables.LOCATION_FACTORS[customer.location_type]
+        location_factor = RateTables.LOCATION_FACTORS[location_type]
         
-        # Vehicle value factor
-        vehicle_value = customer.vehicle_details.value
-        vehicle_factor = 1.0
-        for threshold, factor in RateTables.VEHICLE_VALUE_TIERS:
-            if vehicle_value <= threshold:
-                vehicle_factor = factor
-                break
+        # Vehicle value factor (first tier whose threshold is >= value)
+        vehicle_factor = RateTables.VEHICLE_VALUE_FACTORS[
+            bisect_left(RateTables.VEHICLE_VALUE_THRESHOLDS, vehicle_value)
+        ]
         
         # Additional factors
         additional_factors = {}
         
         # Commercial use adds 20%
-        if customer.vehicle_details.usage == "commercial":
+        if commercial_use:
             additional_factors["commercial_use"] = 1.20
         
         # Newer vehicles (< 5 years) get small discount
-        current_year = datetime.now().year
-        vehicle_age = current_year - customer.vehicle_details.year
+        vehicle_age = current_year - vehicle_year
         if vehicle_age <= 5:
             additional_factors["new_vehicle_discount"] = 0.95
         elif vehicle_age > 15:
             additional_factors["old_vehicle_surcharge"] = 1.10
         
         # Gender factor (in some regions, for demonstration)
-        if customer.gender == Gender.MALE and customer.age < 25:
-            additional_factors["young_male_surcharge"] = 1.10
+        gender_factor = RateTables.GENDER_AGE_FACTORS.get((gender, age < 25))
+        if gender_factor:
+            name, factor = gender_factor
+            additional_factors[name] = factor
         
         # Calculate total premium
         premium = base_premium * age_factor * location_factor * vehicle_factor
@@ -430,40 +795,57 @@ class PremiumCalculator:
         Calculate health insurance premium
         
         Considers: age, smoking status, pre-existing conditions, BMI, exercise
+        
+        Results are memoized; every call returns a fresh copy.
         """
+        health = customer.health_details
+        return _copy_calculation(PremiumCalculator._health_premium(
+            customer.age,
+            customer.location_type,
+            health.smoker,
+            health.pre_existing_conditions,
+            health.bmi,
+            ExerciseFrequency[health.exercise_frequency.upper()]
+        ))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _health_premium(
+        age: int,
+        location_type: LocationType,
+        smoker: bool,
+        pre_existing_conditions: bool,
+        bmi: Optional[float],
+        exercise_frequency: ExerciseFrequency
+    ) -> Dict[str, Any]:
+        """Health premium from primitive inputs (pure, memoized)"""
         base_premium = RateTables.BASE_RATES[InsuranceType.HEALTH]
         
         # Age factor
-        if customer.age < 25:
-            age_factor = 0.85  # Younger people pay less for health insurance
-        elif customer.age > 65:
-            age_factor = 1.50  # Seniors pay more
-        else:
-            age_factor = 1.0
+        age_factor = RateTables.HEALTH_AGE_FACTOR[age]
         
         # Location factor (healthcare costs vary by region)
-        location_factor = RateTables.LOCATION_FACTORS[customer.location_type]
+        location_factor = RateTables.LOCATION_FACTORS[location_type]
         
         # Health-specific factors
         health_factors = {}
-        health = customer.health_details
         
-        if health.smoker:
+        if smoker:
             health_factors["smoker"] = RateTables.HEALTH_FACTORS["smoker"]
         
-        if health.pre_existing_conditions:
+        if pre_existing_conditions:
             health_factors["pre_existing_conditions"] = RateTables.HEALTH_FACTORS["pre_existing"]
         
-        if health.bmi:
-            if health.bmi > 30:
+        if bmi:
+            if bmi > 30:
                 health_factors["high_bmi"] = RateTables.HEALTH_FACTORS["bmi_high"]
-            elif health.bmi < 18.5:
+            elif bmi < 18.5:
                 health_factors["low_bmi"] = RateTables.HEALTH_FACTORS["bmi_low"]
         
-        if health.exercise_frequency == "none":
-            health_factors["no_exercise"] = RateTables.HEALTH_FACTORS["exercise_none"]
-        elif health.exercise_frequency == "frequent":
-            health_factors["frequent_exercise"] = RateTables.HEALTH_FACTORS["exercise_frequent"]
+        exercise_factor = RateTables.EXERCISE_FACTORS[exercise_frequency]
+        if exercise_factor:
+            name, factor = exercise_factor
+            health_factors[name] = factor
         
         # Calculate total premium
         premium = base_premium * age_factor * location_factor
@@ -482,6 +864,119 @@ class PremiumCalculator:
         }
 
 
+# ==================== Report Template ====================
+
+# Report layouts, filled by QuotingTool._format_quote_response via str.format_map.
+# Fields are plain names; values are formatted before substitution.
+BANNER = "=" * 80
+
+VEHICLE_DETAILS_TEMPLATE = """
+Vehicle Information:
+   - Make/Model: {make} {model}
+   - Year: {year}
+   - Value: ${value}
+   - Usage: {usage}
+"""
+
+HEALTH_DETAILS_TEMPLATE = """
+Health Information:
+   - Smoker: {smoker}
+   - Pre-existing Conditions: {pre_existing_conditions}
+   - BMI: {bmi}
+   - Exercise Frequency: {exercise_frequency}
+"""
+
+API_SUCCESS_TEMPLATE = """
+API Integration Status: [OK] - SUCCESS
+   - API Quote ID: {api_quote_id}
+   - Confirmation #: {confirmation_number}
+   - Message: {message}
+"""
+
+API_FALLBACK_TEMPLATE = """
+API Integration Status: [ERROR] - FALLBACK MODE
+   - Note: {fallback}
+"""
+
+QUOTE_REPORT_TEMPLATE = """
+========================================================================
+              INSURANCE QUOTE - DETAILED REPORT
+========================================================================
+
+Quote ID: {quote_id}
+Generated: {timestamp}
+Valid Until: {quote_valid_until}
+
+─────────────────────────────────────────────────────────────────────
+
+CUSTOMER INFORMATION:
+   - Age: {customer_age} years
+   - Gender: {gender}
+   - Location: {address}
+   - Location Type: {location_type}
+   - Insurance Type: {insurance_type}
+{specific_details}
+─────────────────────────────────────────────────────────────────────
+
+PREMIUM CALCULATION:
+   Base Premium: ${base_premium}/month
+   
+   Multiplier Factors:
+   - Age Factor: {age_factor}x
+   - Location Factor: {location_factor}x
+   
+   Additional Risk Factors:
+{factors_text}
+
+   ─────────────────────────────
+   TOTAL MONTHLY PREMIUM: ${total_premium}
+   TOTAL ANNUAL PREMIUM:  ${annual_premium}
+   ─────────────────────────────
+
+─────────────────────────────────────────────────────────────────────
+
+COVERAGE DETAILS:
+{coverage_text}
+
+   Deductible: ${deductible}
+
+─────────────────────────────────────────────────────────────────────
+
+POLICY PERIOD:
+   - Effective Date: {effective_date}
+   - Expiry Date: {expiry_date}
+   - Term: 12 months
+
+─────────────────────────────────────────────────────────────────────
+{api_details}
+─────────────────────────────────────────────────────────────────────
+
+IMPORTANT NOTES:
+   - This quote is subject to underwriting approval
+   - Final premium may vary based on complete application review
+   - All information must be accurate; misrepresentation may void coverage
+   - Quote is valid for 30 days from generation date
+   - GDPR compliant - your data is encrypted and secured
+
+Next Steps:
+   1. Review the quote details carefully
+   2. Prepare required documentation
+   3. Complete the insurance application
+   4. Submit for underwriting review
+
+========================================================================
+""".strip()  # Trimmed once here so rendered reports need no .strip()
+
+
+@functools.lru_cache(maxsize=None)
+def _coverage_text(insurance_type: InsuranceType) -> str:
+    """Coverage lines for the report, rendered once per insurance type"""
+    return "\n".join(
+        f"   - {RateTables.COVERAGE_LABELS[key]}: {value}"
+        for key, value in RateTables.COVERAGE_DETAILS[insurance_type].items()
+    )
+
+
 # ==================== Main Quoting Tool ====================
 
 class QuotingTool(BaseTool):
@@ -520,6 +1015,9 @@ class QuotingTool(BaseTool):
     """
     args_schema: Type[BaseModel] = QuotingToolInput
     
+    # Upper bound on concurrent quotes in arun_many (protects the upstream API)
+    max_concurrency: int = 50
+    
     def _run(self, customer_data_json: str) -> str:
         """
         Calculate insurance quote
@@ -531,93 +1029,49 @@ class QuotingTool(BaseTool):
             Formatted quote string with all details
         """
         try:
-            # Parse and validate customer data
-            logger.info("Parsing customer data...")
-            customer_data_dict = json.loads(customer_data_json)
+            # Parse and validate customer data in one pass (pydantic-core)
+            logger.debug("Parsing customer data...")
             
             try:
-                customer = CustomerData(**customer_data_dict)
-            except Exception as validation_error:
+                customer = CustomerData.model_validate_json(customer_data_json)
+            except ValidationError as validation_error:
+                json_error = _invalid_json_details(validation_error)
+                if json_error:
+                    logger.error("JSON decode error: %s", json_error)
+                    return self._format_json_error(json_error)
+                
                 error_msg = self._format_validation_error(validation_error)
-                logger.warning(f"Validation error: {error_msg}")
+                logger.warning("Validation error: %s", error_msg)
                 return error_msg
             
+            # Single timestamp for the whole quote
+            now = datetime.now()
+            
             # Calculate premium based on insurance type
-            logger.info(f"Calculating {customer.insurance_type.value} insurance premium...")
+            logger.debug("Calculating %s insurance premium...", customer.insurance_type.value)
             
             if customer.insurance_type == InsuranceType.AUTO:
-                calculation = PremiumCalculator.calculate_auto_insurance(customer)
+                calculation = PremiumCalculator.calculate_auto_insurance(customer, now.year)
             else:
                 calculation = PremiumCalculator.calculate_health_insurance(customer)
             
-            # Generate quote ID and dates
-            quote_id = f"QT-{datetime.now().strftime('%Y%m%d%H%M%S')}-{customer.insurance_type.value.upper()}"
-            now = datetime.now()
-            effective_date = now + timedelta(days=1)
-            expiry_date = effective_date + timedelta(days=365)
-            valid_until = now + timedelta(days=30)
-            
-            # Prepare coverage details
-            coverage = RateTables.COVERAGE_DETAILS[customer.insurance_type]
-            deductible = RateTables.DEDUCTIBLES[customer.insurance_type]
-            
-            # Create quote result
-            quote = QuoteResult(
-                quote_id=quote_id,
-                customer_age=customer.age,
-                insurance_type=customer.insurance_type.value,
-                base_premium=calculation["base_premium"],
-                age_factor=calculation["age_factor"],
-                location_factor=calculation["location_factor"],
-                additional_factors=calculation.get("additional_factors", {}),
-                total_premium=calculation["total_monthly_premium"],
-                annual_premium=calculation["total_annual_premium"],
-                coverage_details=coverage,
-                deductible=deductible,
-                effective_date=effective_date.strftime("%Y-%m-%d"),
-                expiry_date=expiry_date.strftime("%Y-%m-%d"),
-                quote_valid_until=valid_until.strftime("%Y-%m-%d"),
-                timestamp=now.isoformat()
-            )
+            # Build quote (fields come from validated input and rate tables)
+            quote_data = self._build_quote_data(customer, calculation, now, "QT-")
+            quote = QuoteResult.model_construct(**quote_data)
+            quote_id = quote.quote_id
             
             # Submit to external API
-            logger.info("Submitting quote to external API...")
-            api_response = InsuranceAPIClient.submit_quote(quote.model_dump())
+            logger.debug("Submitting quote to external API...")
+            api_response = InsuranceAPIClient.submit_quote(quote_data)
             
             # Format response
             response = self._format_quote_response(customer, quote, calculation, api_response)
             
-            logger.info(f"Quote generated successfully: {quote_id}")
+            logger.info("Quote generated successfully: %s", quote_id)
             return response
             
-        except json.JSONDecodeError as e:
-            error_msg = f"""
-ERROR: Invalid JSON format
-------------------------
-The input must be a valid JSON string.
-
-Error details: {str(e)}
-
-Example format:
-{{
-    "age": 30,
-    "gender": "male",
-    "address": "123 Main St, New York, NY",
-    "location_type": "urban",
-    "insurance_type": "auto",
-    "vehicle_details": {{
-        "make": "Tesla",
-        "model": "Model 3",
-        "year": 2022,
-        "value": 45000
-    }}
-}}
-            """
-            logger.error(f"JSON decode error: {str(e)}")
-            return error_msg.strip()
-            
         except Exception as e:
-            logger.error(f"Error in quoting tool: {str(e)}", exc_info=True)
+            logger.error("Error in quoting tool: %s", e, exc_info=True)
             return f"ERROR: Failed to generate quote - {str(e)}"
     
     async def _arun(self, customer_data_json: str) -> str:
@@ -631,74 +1085,142 @@ Example format:
             Formatted quote string with all details
         """
         try:
-            # Parse and validate customer data
-            logger.info("Parsing customer data (async)...")
-            customer_data_dict = json.loads(customer_data_json)
+            # Parse and validate customer data in one pass (pydantic-core)
+            logger.debug("Parsing customer data (async)...")
             
             try:
-                customer = CustomerData(**customer_data_dict)
-            except Exception as validation_error:
+                customer = CustomerData.model_validate_json(customer_data_json)
+            except ValidationError as validation_error:
+                json_error = _invalid_json_details(validation_error)
+                if json_error:
+                    error_msg = f"ERROR: Invalid JSON format - {json_error}"
+                    logger.error(error_msg)
+                    return error_msg
+                
                 error_msg = self._format_validation_error(validation_error)
-                logger.warning(f"Validation error: {error_msg}")
+                logger.warning("Validation error: %s", error_msg)
                 return error_msg
             
+            # Single timestamp for the whole quote
+            now = datetime.now()
+            
             # Calculate premium based on insurance type
-            logger.info(f"Calculating {customer.insurance_type.value} insurance premium (async)...")
+            logger.debug("Calculating %s insurance premium (async)...", customer.insurance_type.value)
             
             if customer.insurance_type == InsuranceType.AUTO:
-                calculation = PremiumCalculator.calculate_auto_insurance(customer)
+                calculation = PremiumCalculator.calculate_auto_insurance(customer, now.year)
             else:
                 calculation = PremiumCalculator.calculate_health_insurance(customer)
             
-            # Generate quote ID and dates
-            quote_id = f"QT-ASYNC-{datetime.now().strftime('%Y%m%d%H%M%S')}-{customer.insurance_type.value.upper()}"
-            now = datetime.now()
-            effective_date = now + timedelta(days=1)
-            expiry_date = effective_date + timedelta(days=365)
-            valid_until = now + timedelta(days=30)
-            
-            # Prepare coverage details
-            coverage = RateTables.COVERAGE_DETAILS[customer.insurance_type]
-            deductible = RateTables.DEDUCTIBLES[customer.insurance_type]
-            
-            # Create quote result
-            quote = QuoteResult(
-                quote_id=quote_id,
-                customer_age=customer.age,
-                insurance_type=customer.insurance_type.value,
-                base_premium=calculation["base_premium"],
-                age_factor=calculation["age_factor"],
-                location_factor=calculation["location_factor"],
-                additional_factors=calculation.get("additional_factors", {}),
-                total_premium=calculation["total_monthly_premium"],
-                annual_premium=calculation["total_annual_premium"],
-                coverage_details=coverage,
-                deductible=deductible,
-                effective_date=effective_date.strftime("%Y-%m-%d"),
-                expiry_date=expiry_date.strftime("%Y-%m-%d"),
-                quote_valid_until=valid_until.strftime("%Y-%m-%d"),
-                timestamp=now.isoformat()
-            )
+            # Build quote (fields come from validated input and rate tables)
+            quote_data = self._build_quote_data(customer, calculation, now, "QT-ASYNC-")
+            quote = QuoteResult.model_construct(**quote_data)
+            quote_id = quote.quote_id
             
             # Submit to external API (async)
-            logger.info("Submitting quote to external API (async)...")
-            api_response = await InsuranceAPIClient.submit_quote_async(quote.model_dump())
+            logger.debug("Submitting quote to external API (async)...")
+            api_response = await InsuranceAPIClient.submit_quote_async(quote_data)
             
             # Format response
             response = self._format_quote_response(customer, quote, calculation, api_response)
             
-            logger.info(f"Quote generated successfully (async): {quote_id}")
+            logger.info("Quote generated successfully (async): %s", quote_id)
             return response
             
-        except json.JSONDecodeError as e:
-            error_msg = f"ERROR: Invalid JSON format - {str(e)}"
-            logger.error(error_msg)
-            return error_msg
-            
         except Exception as e:
-            logger.error(f"Error in async quoting tool: {str(e)}", exc_info=True)
+            logger.error("Error in async quoting tool: %s", e, exc_info=True)
             return f"ERROR: Failed to generate quote (async) - {str(e)}"
     
+    async def arun_many(self, customer_data_jsons: List[str]) -> List[str]:
+        """
+        Generate several quotes concurrently
+        
+        At most max_concurrency quotes are in flight at once; all of them share
+        InsuranceAPIClient's pooled session. A failure in one quote does not
+        cancel the others.
+        
+        Args:
+            customer_data_jsons: JSON strings with customer data
+            
+        Returns:
+            Formatted quote strings (or error strings), in input order
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def run_one(customer_data_json: str) -> str:
+            async with semaphore:
+                return await self._arun(customer_data_json)
+        
+        results = await asyncio.gather(
+            *(run_one(j) for j in customer_data_jsons),
+            return_exceptions=True
+        )
+        return [
+            f"ERROR: Failed to generate quote (async) - {str(result)}"
+            if isinstance(result, Exception) else result
+            for result in results
+        ]
+    
+    def _build_quote_data(
+        self,
+        customer: CustomerData,
+        calculation: Dict[str, Any],
+        now: datetime,
+        quote_id_prefix: str
+    ) -> Dict[str, Any]:
+        """
+        Build QuoteResult fields as a plain dict
+        
+        Every value is derived from already-validated customer data and the
+        static rate tables, so callers can skip pydantic validation
+        (QuoteResult.model_construct) and submit the dict as-is.
+        """
+        effective_date, expiry_date, valid_until = _quote_dates(now.date())
+        
+        return {
+            "quote_id": f"{quote_id_prefix}{now.strftime('%Y%m%d%H%M%S')}-{customer.insurance_type.upper_value}",
+            "customer_age": customer.age,
+            "insurance_type": customer.insurance_type.value,
+            "base_premium": calculation["base_premium"],
+            "age_factor": calculation["age_factor"],
+            "location_factor": calculation["location_factor"],
+            "additional_factors": calculation.get("additional_factors", {}),
+            "total_premium": calculation["total_monthly_premium"],
+            "annual_premium": calculation["total_annual_premium"],
+            # Copied: the quote is handed to callers and serializers
+            "coverage_details": dict(RateTables.COVERAGE_DETAILS[customer.insurance_type]),
+            "deductible": RateTables.DEDUCTIBLES[customer.insurance_type],
+            "effective_date": effective_date,
+            "expiry_date": expiry_date,
+            "quote_valid_until": valid_until,
+            "timestamp": now.isoformat()
+        }
+    
+    def _format_json_error(self, details: str) -> str:
+        """Format invalid JSON error message for user"""
+        return f"""
+ERROR: Invalid JSON format
+------------------------
+The input must be a valid JSON string.
+
+Error details: {details}
+
+Example format:
+{{
+    "age": 30,
+    "gender": "male",
+    "address": "123 Main St, New York, NY",
+    "location_type": "urban",
+    "insurance_type": "auto",
+    "vehicle_details": {{
+        "make": "Tesla",
+        "model": "Model 3",
+        "year": 2022,
+        "value": 45000
+    }}
+}}
+        """.strip()
+    
     def _format_validation_error(self, error: Exception) -> str:
         """Format validation error messages for user"""
         error_str = str(error)
@@ -739,146 +1261,84 @@ Please ensure all required fields are provided with valid values.
         """Format comprehensive quote response"""
         
         # Format additional factors
-        factors_text = ""
-        all_factors = {**calculation.get("health_factors", {}), **quote.additional_factors}
-        if all_factors:
-            factors_text = "\n".join(
-                f"   - {key.replace('_', ' ').title()}: {value:.2f}x"
-                for key, value in all_factors.items()
+        factors_text = "\n".join(
+            f"   - {RateTables.FACTOR_LABELS[key]}: {value:.2f}x"
+            for key, value in itertools.chain(
+                calculation.get("health_factors", {}).items(),
+                quote.additional_factors.items()
             )
-        else:
-            factors_text = "   - None"
+        ) or "   - None"
         
-        # Format coverage details
-        coverage_text = "\n".join(
-            f"   - {key.replace('_', ' ').title()}: {value}"
-            for key, value in quote.coverage_details.items()
-        )
+        # Coverage details only depend on the insurance type
+        coverage_text = _coverage_text(customer.insurance_type)
         
         # Insurance-specific details
-        specific_details = ""
         if customer.insurance_type == InsuranceType.AUTO:
             vehicle = customer.vehicle_details
-            specific_details = f"""
-Vehicle Information:
-   - Make/Model: {vehicle.make} {vehicle.model}
-   - Year: {vehicle.year}
-   - Value: ${vehicle.value:,.2f}
-   - Usage: {vehicle.usage.title()}
-            """
+            specific_details = VEHICLE_DETAILS_TEMPLATE.format_map({
+                "make": vehicle.make,
+                "model": vehicle.model,
+                "year": vehicle.year,
+                "value": f"{vehicle.value:,.2f}",
+                "usage": vehicle.usage.title()
+            })
         else:
             health = customer.health_details
-            specific_details = f"""
-Health Information:
-   - Smoker: {'Yes' if health.smoker else 'No'}
-   - Pre-existing Conditions: {'Yes' if health.pre_existing_conditions else 'No'}
-   - BMI: {health.bmi if health.bmi else 'Not provided'}
-   - Exercise Frequency: {health.exercise_frequency.title()}
-            """
+            specific_details = HEALTH_DETAILS_TEMPLATE.format_map({
+                "smoker": "Yes" if health.smoker else "No",
+                "pre_existing_conditions": "Yes" if health.pre_existing_conditions else "No",
+                "bmi": health.bmi if health.bmi else "Not provided",
+                "exercise_frequency": health.exercise_frequency.title()
+            })
         
         # API integration details
-        api_status = "[OK]" if api_response.get("status") == "success" else "[ERROR]"
-        api_details = ""
         if api_response.get("status") == "success":
-            api_details = f"""
-API Integration Status: {api_status} - SUCCESS
-   - API Quote ID: {api_response.get('api_quote_id')}
-   - Confirmation #: {api_response.get('confirmation_number')}
-   - Message: {api_response.get('message')}
-            """
+            api_details = API_SUCCESS_TEMPLATE.format_map({
+                "api_quote_id": api_response.get("api_quote_id"),
+                "confirmation_number": api_response.get("confirmation_number"),
+                "message": api_response.get("message")
+            })
         else:
-            api_details = f"""
-API Integration Status: {api_status} - FALLBACK MODE
-   - Note: {api_response.get('fallback', 'Quote generated locally')}
-            """
+            api_details = API_FALLBACK_TEMPLATE.format_map({
+                "fallback": api_response.get("fallback", "Quote generated locally")
+            })
         
-        response = f"""
-========================================================================
-              INSURANCE QUOTE - DETAILED REPORT
-========================================================================
-
-Quote ID: {quote.quote_id}
-Generated: {quote.timestamp}
-Valid Until: {quote.quote_valid_until}
-
-─────────────────────────────────────────────────────────────────────
-
-CUSTOMER INFORMATION:
-   - Age: {customer.age} years
-   - Gender: {customer.gender.value.title()}
-   - Location: {customer.address}
-   - Location Type: {customer.location_type.value.title()}
-   - Insurance Type: {customer.insurance_type.value.upper()}
-{specific_details}
-─────────────────────────────────────────────────────────────────────
-
-PREMIUM CALCULATION:
-   Base Premium: ${quote.base_premium:.2f}/month
-   
-   Multiplier Factors:
-   - Age Factor: {quote.age_factor:.2f}x
-   - Location Factor: {quote.location_factor:.2f}x
-   
-   Additional Risk Factors:
-{factors_text}
-
-   ─────────────────────────────
-   TOTAL MONTHLY PREMIUM: ${quote.total_premium:.2f}
-   TOTAL ANNUAL PREMIUM:  ${quote.annual_premium:.2f}
-   ─────────────────────────────
-
-─────────────────────────────────────────────────────────────────────
-
-COVERAGE DETAILS:
-{coverage_text}
-
-   Deductible: ${quote.deductible:,.2f}
-
-─────────────────────────────────────────────────────────────────────
-
-POLICY PERIOD:
-   - Effective Date: {quote.effective_date}
-   - Expiry Date: {quote.expiry_date}
-   - Term: 12 months
-
-─────────────────────────────────────────────────────────────────────
-{api_details}
-─────────────────────────────────────────────────────────────────────
-
-IMPORTANT NOTES:
-   - This quote is subject to underwriting approval
-   - Final premium may vary based on complete application review
-   - All information must be accurate; misrepresentation may void coverage
-   - Quote is valid for 30 days from generation date
-   - GDPR compliant - your data is encrypted and secured
-
-Next Steps:
-   1. Review the quote details carefully
-   2. Prepare required documentation
-   3. Complete the insurance application
-   4. Submit for underwriting review
-
-========================================================================
-        """
+        response = QUOTE_REPORT_TEMPLATE.format_map({
+            "quote_id": quote.quote_id,
+            "timestamp": quote.timestamp,
+            "quote_valid_until": quote.quote_valid_until,
+            "customer_age": customer.age,
+            "gender": customer.gender.value.title(),
+            "address": customer.address,
+            "location_type": customer.location_type.value.title(),
+            "insurance_type": customer.insurance_type.upper_value,
+            "specific_details": specific_details,
+            "base_premium": f"{quote.base_premium:.2f}",
+            "age_factor": f"{quote.age_factor:.2f}",
+            "location_factor": f"{quote.location_factor:.2f}",
+            "factors_text": factors_text,
+            "total_premium": f"{quote.total_premium:.2f}",
+            "annual_premium": f"{quote.annual_premium:.2f}",
+            "coverage_text": coverage_text,
+            "deductible": f"{quote.deductible:,.2f}",
+            "effective_date": quote.effective_date,
+            "expiry_date": quote.expiry_date,
+            "api_details": api_details
+        })
         
-        return response.strip()
+        return response
 
 
 # ==================== Standalone Usage Example ====================
 
-def example_usage():
-    """Demonstrate the QuotingTool usage"""
-    print("=" * 80)
+def example_usage(loop_factory: Optional[Callable[[], asyncio.AbstractEventLoop]] = None):
+    """Demonstrate the QuotingTool usage (loop_factory creates the async example's event loop)"""
+    print(BANNER)
     print("Advanced Insurance Quoting Tool - Standalone Demo")
-    print("=" * 80)
+    print(BANNER)
     
     tool = QuotingTool()
     
-    # Example 1: Auto Insurance Quote
-    print("\n\n" + "=" * 80)
-    print("EXAMPLE 1: Auto Insurance Quote")
-    print("=" * 80)
-    
     auto_quote_data = {
         "age": 23,
         "gender": "male",
@@ -894,14 +1354,6 @@ def example_usage():
         }
     }
     
-    result = tool._run(json.dumps(auto_quote_data))
-    print(result)
-    
-    # Example 2: Health Insurance Quote
-    print("\n\n" + "=" * 80)
-    print("EXAMPLE 2: Health Insurance Quote")
-    print("=" * 80)
-    
     health_quote_data = {
         "age": 35,
         "gender": "female",
@@ -916,14 +1368,6 @@ def example_usage():
         }
     }
     
-    result = tool._run(json.dumps(health_quote_data))
-    print(result)
-    
-    # Example 3: Error Handling - Incomplete Data
-    print("\n\n" + "=" * 80)
-    print("EXAMPLE 3: Error Handling - Incomplete Data")
-    print("=" * 80)
-    
     incomplete_data = {
         "age": 30,
         "gender": "male",
@@ -931,25 +1375,52 @@ def example_usage():
         # Missing required fields
     }
     
-    result = tool._run(json.dumps(incomplete_data))
-    print(result)
+    examples = [
+        ("EXAMPLE 1: Auto Insurance Quote", auto_quote_data),
+        ("EXAMPLE 2: Health Insurance Quote", health_quote_data),
+        ("EXAMPLE 3: Error Handling - Incomplete Data", incomplete_data)
+    ]
+    payloads = [json.dumps(data) for _, data in examples]
+    
+    # The examples are independent, so generate them concurrently and print in order
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(payloads)) as executor:
+        results = list(executor.map(tool._run, payloads))
+    
+    for (title, _), result in zip(examples, results):
+        print("\n\n" + BANNER)
+        print(title)
+        print(BANNER)
+        print(result)
     
     # Example 4: Async Usage
-    print("\n\n" + "=" * 80)
+    print("\n\n" + BANNER)
     print("EXAMPLE 4: Async Quote Generation")
-    print("=" * 80)
+    print(BANNER)
     
     async def async_example():
-        result = await tool._arun(json.dumps(auto_quote_data))
-        print(result)
+        # Quotes share the event loop and the pooled API session
+        for result in await tool.arun_many(payloads[:2]):
+            print(result)
+        await InsuranceAPIClient.close()
     
-    asyncio.run(async_example())
+    # The runner closes its loop on exit
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(async_example())
     
-    print("\n" + "=" * 80)
+    print("\n" + BANNER)
     print("Demo Complete!")
-    print("=" * 80)
+    print(BANNER)
 
 
 if __name__ == "__main__":
-    example_usage()
+    logging.basicConfig(level=logging.INFO)
+    
+    # uvloop for a faster event loop in the demo (optional)
+    try:
+        import uvloop
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+    
+    example_usage(loop_factory)
 
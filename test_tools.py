@@ -3,73 +3,108 @@ Unit Tests for Insurance AI Agent Tools
 Tests quoting, underwriting, and document filling functionality
 """
 
+import os
+import asyncio
+import re
+import copy
+import numpy as np
 import pytest
 import json
 from pathlib import Path
 
 # Import tools
-from quoting_tool import QuotingTool, CustomerData, InsuranceType
-from underwriting_tool import UnderwritingTool, ApplicantData
-from document_filling_tool import DocumentFillingTool, CustomerInfo
+from quoting_tool import QuotingTool, CustomerData, InsuranceType, PremiumCalculator, InsuranceAPIClient
+from underwriting_tool import (
+    UnderwritingTool, ApplicantData, ExternalDataAPI, UnderwritingRuleEngine, RiskCalculator,
+    RiskLevel, get_ml_model, batch_underwrite, batch_underwrite_iter
+)
+from document_filling_tool import DocumentFillingTool, CustomerInfo, PDFGenerator
+
+try:
+    import orjson
+    
+    def dumps_json(data):
+        """Serialize test payloads with orjson when available"""
+        return orjson.dumps(data).decode()
+except ImportError:
+    dumps_json = json.dumps
+
+# Generated PDF location in the document report
+FILE_PATH_RE = re.compile(r"File Path:[ \t]*(.+)")
 
 
 # ==================== Quoting Tool Tests ====================
 
-class TestQuotingTool:
-    """Test suite for QuotingTool"""
-    
-    @pytest.fixture
-    def quoting_tool(self):
-        """Create QuotingTool instance"""
-        return QuotingTool()
-    
-    @pytest.fixture
-    def valid_auto_data(self):
-        """Valid auto insurance data"""
-        return {
-            "age": 30,
-            "gender": "male",
-            "address": "123 Main St, New York, NY",
-            "location_type": "urban",
-            "insurance_type": "auto",
-            "vehicle_details": {
-                "make": "Honda",
-                "model": "Accord",
-                "year": 2020,
-                "value": 28000,
-                "usage": "personal"
-            }
+@pytest.fixture(scope="class")
+def quoting_tool():
+    """Create QuotingTool instance"""
+    return QuotingTool()
+
+
+@pytest.fixture(scope="class")
+def valid_auto_data():
+    """Valid auto insurance data"""
+    return {
+        "age": 30,
+        "gender": "male",
+        "address": "123 Main St, New York, NY",
+        "location_type": "urban",
+        "insurance_type": "auto",
+        "vehicle_details": {
+            "make": "Honda",
+            "model": "Accord",
+            "year": 2020,
+            "value": 28000,
+            "usage": "personal"
         }
-    
-    @pytest.fixture
-    def valid_health_data(self):
-        """Valid health insurance data"""
-        return {
-            "age": 35,
-            "gender": "female",
-            "address": "456 Elm St, Los Angeles, CA",
-            "location_type": "suburban",
-            "insurance_type": "health",
-            "health_details": {
-                "smoker": False,
-                "pre_existing_conditions": False,
-                "bmi": 24.5,
-                "exercise_frequency": "regular"
-            }
+    }
+
+
+@pytest.fixture(scope="class")
+def valid_health_data():
+    """Valid health insurance data"""
+    return {
+        "age": 35,
+        "gender": "female",
+        "address": "456 Elm St, Los Angeles, CA",
+        "location_type": "suburban",
+        "insurance_type": "health",
+        "health_details": {
+            "smoker": False,
+            "pre_existing_conditions": False,
+            "bmi": 24.5,
+            "exercise_frequency": "regular"
         }
+    }
+
+
+@pytest.fixture(scope="class")
+def valid_auto_json(valid_auto_data):
+    """Valid auto data serialized once per class"""
+    return dumps_json(valid_auto_data)
+
+
+@pytest.fixture(scope="class")
+def valid_health_json(valid_health_data):
+    """Valid health data serialized once per class"""
+    return dumps_json(valid_health_data)
+
+
+class TestQuotingTool:
+    """Test suite for QuotingTool"""
     
-    def test_auto_insurance_quote(self, quoting_tool, valid_auto_data):
+    def test_auto_insurance_quote(self, quoting_tool, valid_auto_json):
         """Test auto insurance quote generation"""
-        result = quoting_tool._run(json.dumps(valid_auto_data))
+        result = quoting_tool._run(valid_auto_json)
         
         assert "INSURANCE QUOTE - DETAILED REPORT" in result
         assert "TOTAL MONTHLY PREMIUM:" in result
         assert "AUTO" in result
         assert "Honda Accord" in result
     
-    def test_health_insurance_quote(self, quoting_tool, valid_health_data):
+    def test_health_insurance_quote(self, quoting_tool, valid_health_json):
         """Test health insurance quote generation"""
-        result = quoting_tool._run(json.dumps(valid_health_data))
+        result = quoting_tool._run(valid_health_json)
         
         assert "INSURANCE QUOTE - DETAILED REPORT" in result
         assert "TOTAL MONTHLY PREMIUM:" in result
@@ -87,7 +122,7 @@ class TestQuotingTool:
             # Missing vehicle_details
         }
         
-        result = quoting_tool._run(json.dumps(invalid_data))
+        result = quoting_tool._run(dumps_json(invalid_data))
         assert "ERROR" in result or "required" in result.lower()
     
     def test_invalid_json(self, quoting_tool):
@@ -98,87 +133,210 @@ class TestQuotingTool:
     
     def test_young_driver_premium(self, quoting_tool, valid_auto_data):
         """Test that young drivers get higher premiums"""
-        valid_auto_data["age"] = 22
-        result = quoting_tool._run(json.dumps(valid_auto_data))
+        data = copy.deepcopy(valid_auto_data)
+        data["age"] = 22
+        result = quoting_tool._run(dumps_json(data))
         
         assert "Age Factor: 1.20" in result  # Young driver factor
+    
+    def test_async_session_closed_when_loop_changes(self):
+        """Test that the aiohttp session of a finished event loop is closed, not leaked"""
+        pytest.importorskip("aiohttp")
+        
+        first = asyncio.run(InsuranceAPIClient._get_async_session())
+        second = asyncio.run(InsuranceAPIClient._get_async_session())
+        assert first.closed and not second.closed
+        
+        asyncio.run(InsuranceAPIClient.close())
+        assert second.closed
+    
+    def test_memoized_premiums_are_copied(self, valid_auto_data):
+        """Test that mutating a returned calculation does not leak into later quotes"""
+        customer = CustomerData(**valid_auto_data)
+        
+        first = PremiumCalculator.calculate_auto_insurance(customer, 2025)
+        first["additional_factors"]["tampered"] = 2.0
+        first["total_monthly_premium"] = 0.0
+        second = PremiumCalculator.calculate_auto_insurance(customer, 2025)
+        
+        assert "tampered" not in second["additional_factors"]
+        assert second["total_monthly_premium"] > 0
+    
+    def test_auto_batch_matches_single_quote(self, valid_auto_data):
+        """Test that batch pricing agrees with the per-customer calculation"""
+        customers = []
+        for age, value, year, usage in [(22, 15000, 2024, "personal"),
+                                        (40, 55000, 2008, "commercial"),
+                                        (70, 120000, 2015, "personal")]:
+            data = copy.deepcopy(valid_auto_data)
+            data["age"] = age
+            data["vehicle_details"].update(value=value, year=year, usage=usage)
+            customers.append(CustomerData(**data))
+        
+        premiums = PremiumCalculator.calculate_auto_batch(
+            **PremiumCalculator.encode_auto_batch(customers), current_year=2025
+        )
+        
+        for customer, premium in zip(customers, premiums):
+            expected = PremiumCalculator.calculate_auto_insurance(customer, 2025)
+            assert premium == expected["total_monthly_premium"]
+    
+    def test_auto_batch_jit_path_matches_single_quote(self, valid_auto_data):
+        """Test that a batch large enough for the compiled kernel prices exactly like single quotes"""
+        customers = []
+        for i in range(PremiumCalculator.NUMBA_MIN_BATCH):
+            data = copy.deepcopy(valid_auto_data)
+            data.update(
+                age=18 + i % 83,
+                gender=("male", "female")[i % 2],
+                location_type=("urban", "suburban", "rural")[i % 3]
+            )
+            data["vehicle_details"].update(
+                value=5000 + (i * 997) % 150000,
+                year=1990 + i % 36,
+                usage=("personal", "commercial")[i % 5 == 0]
+            )
+            customers.append(CustomerData(**data))
+        
+        premiums = PremiumCalculator.calculate_auto_batch(
+            **PremiumCalculator.encode_auto_batch(customers), current_year=2025
+        )
+        
+        assert premiums.tolist() == [
+            PremiumCalculator.calculate_auto_insurance(customer, 2025)["total_monthly_premium"]
+            for customer in customers
+        ]
+    
+    def test_auto_batch_rejects_out_of_range_codes(self, valid_auto_data):
+        """Test that batch pricing refuses ages and codes outside the rate tables"""
+        encoded = PremiumCalculator.encode_auto_batch([CustomerData(**valid_auto_data)])
+        
+        with pytest.raises(ValueError):
+            PremiumCalculator.calculate_auto_batch(**{**encoded, "ages": [101]})
+        with pytest.raises(ValueError):
+            PremiumCalculator.calculate_auto_batch(**{**encoded, "loc_idx": [-1]})
 
 
 # ==================== Underwriting Tool Tests ====================
 
-class TestUnderwritingTool:
-    """Test suite for UnderwritingTool"""
-    
-    @pytest.fixture
-    def underwriting_tool(self):
-        """Create UnderwritingTool instance"""
-        return UnderwritingTool()
-    
-    @pytest.fixture
-    def good_applicant_data(self):
-        """Good risk applicant data"""
-        return {
-            "applicant_id": "TEST-001",
-            "name": "John Smith",
-            "age": 35,
-            "credit_score": 750,
-            "annual_income": 75000,
-            "employment_status": "employed",
-            "insurance_type": "auto",
-            "coverage_amount": 100000,
-            "claims_history": {
-                "total_claims": 1,
-                "claims_last_3_years": 0,
-                "total_claimed_amount": 5000,
-                "fraud_indicators": False
-            },
-            "driving_record": {
-                "years_licensed": 15,
-                "accidents_last_5_years": 0,
-                "violations_last_3_years": 0,
-                "dui_history": False,
-                "license_suspended": False
-            }
+@pytest.fixture(scope="class")
+def underwriting_tool():
+    """Create UnderwritingTool instance"""
+    return UnderwritingTool()
+
+
+@pytest.fixture(scope="class")
+def good_applicant_data():
+    """Good risk applicant data"""
+    return {
+        "applicant_id": "TEST-001",
+        "name": "John Smith",
+        "age": 35,
+        "credit_score": 750,
+        "annual_income": 75000,
+        "employment_status": "employed",
+        "insurance_type": "auto",
+        "coverage_amount": 100000,
+        "claims_history": {
+            "total_claims": 1,
+            "claims_last_3_years": 0,
+            "total_claimed_amount": 5000,
+            "fraud_indicators": False
+        },
+        "driving_record": {
+            "years_licensed": 15,
+            "accidents_last_5_years": 0,
+            "violations_last_3_years": 0,
+            "dui_history": False,
+            "license_suspended": False
         }
-    
-    @pytest.fixture
-    def high_risk_applicant_data(self):
-        """High risk applicant data"""
-        return {
-            "applicant_id": "TEST-002",
-            "name": "Jane Doe",
-            "age": 22,
-            "credit_score": 580,
-            "annual_income": 30000,
-            "employment_status": "employed",
-            "insurance_type": "auto",
-            "coverage_amount": 50000,
-            "claims_history": {
-                "total_claims": 4,
-                "claims_last_3_years": 3,
-                "total_claimed_amount": 25000,
-                "fraud_indicators": False
-            },
-            "driving_record": {
-                "years_licensed": 3,
-                "accidents_last_5_years": 2,
-                "violations_last_3_years": 4,
-                "dui_history": False,
-                "license_suspended": False
-            }
+    }
+
+
+@pytest.fixture(scope="class")
+def high_risk_applicant_data():
+    """High risk applicant data"""
+    return {
+        "applicant_id": "TEST-002",
+        "name": "Jane Doe",
+        "age": 22,
+        "credit_score": 580,
+        "annual_income": 30000,
+        "employment_status": "employed",
+        "insurance_type": "auto",
+        "coverage_amount": 50000,
+        "claims_history": {
+            "total_claims": 4,
+            "claims_last_3_years": 3,
+            "total_claimed_amount": 25000,
+            "fraud_indicators": False
+        },
+        "driving_record": {
+            "years_licensed": 3,
+            "accidents_last_5_years": 2,
+            "violations_last_3_years": 4,
+            "dui_history": False,
+            "license_suspended": False
         }
+    }
+
+
+@pytest.fixture(scope="class")
+def varied_applicants(good_applicant_data):
+    """Applicants spread over every insurance type and the age, credit and claims bands"""
+    applicants = []
+    for i, age in enumerate((18, 24, 25, 29, 30, 45, 65, 66, 70, 71, 85, 100)):
+        for j, insurance_type in enumerate(("auto", "home", "life", "health")):
+            data = copy.deepcopy(good_applicant_data)
+            data.update(
+                applicant_id=f"TEST-V{i:02d}{j}",
+                age=age,
+                credit_score=300 + (i * 137 + j * 61) % 551,
+                insurance_type=insurance_type,
+                smoker=(i + j) % 2 == 1,
+                property_info={
+                    "property_age": 60 if i % 3 == 0 else 10,
+                    "construction_type": "wood",
+                    "fire_protection_class": 1 + i % 10,
+                    "flood_zone": i % 4 == 0
+                }
+            )
+            data["claims_history"]["claims_last_3_years"] = (i + j) % 6
+            data["driving_record"].update(
+                accidents_last_5_years=i % 4,
+                violations_last_3_years=j % 4,
+                dui_history=(i + j) % 7 == 0
+            )
+            applicants.append(ApplicantData(**data))
+    return applicants
+
+
+@pytest.fixture(scope="class")
+def good_applicant_json(good_applicant_data):
+    """Good applicant data serialized once per class"""
+    return dumps_json(good_applicant_data)
+
+
+@pytest.fixture(scope="class")
+def high_risk_applicant_json(high_risk_applicant_data):
+    """High risk applicant data serialized once per class"""
+    return dumps_json(high_risk_applicant_data)
+
+
+class TestUnderwritingTool:
+    """Test suite for UnderwritingTool"""
     
-    def test_approve_good_risk(self, underwriting_tool, good_applicant_data):
+    def test_approve_good_risk(self, underwriting_tool, good_applicant_json):
         """Test approval of good risk applicant"""
-        result = underwriting_tool._run(json.dumps(good_applicant_data))
+        result = underwriting_tool._run(good_applicant_json)
         
         assert "UNDERWRITING DECISION REPORT" in result
         assert "[APPROVED]" in result
         assert "TEST-001" in result
     
-    def test_high_risk_conditions(self, underwriting_tool, high_risk_applicant_data):
+    def test_high_risk_conditions(self, underwriting_tool, high_risk_applicant_json):
         """Test high risk applicant gets conditions"""
-        result = underwriting_tool._run(json.dumps(high_risk_applicant_data))
+        result = underwriting_tool._run(high_risk_applicant_json)
         
         assert "UNDERWRITING DECISION REPORT" in result
         # Should be approved with conditions or referred
@@ -186,14 +344,15 @@ class TestUnderwritingTool:
     
     def test_dui_decline(self, underwriting_tool, good_applicant_data):
         """Test DUI history leads to decline"""
-        good_applicant_data["driving_record"]["dui_history"] = True
-        result = underwriting_tool._run(json.dumps(good_applicant_data))
+        data = copy.deepcopy(good_applicant_data)
+        data["driving_record"]["dui_history"] = True
+        result = underwriting_tool._run(dumps_json(data))
         
         assert "DECLINED" in result or "DUI" in result
     
-    def test_risk_score_calculation(self, underwriting_tool, good_applicant_data):
+    def test_risk_score_calculation(self, underwriting_tool, good_applicant_json):
         """Test risk score is calculated"""
-        result = underwriting_tool._run(json.dumps(good_applicant_data))
+        result = underwriting_tool._run(good_applicant_json)
         
         assert "Risk Score:" in result
         assert "/100" in result
@@ -218,49 +377,310 @@ class TestUnderwritingTool:
             # Missing driving_record
         }
         
-        result = underwriting_tool._run(json.dumps(invalid_data))
+        result = underwriting_tool._run(dumps_json(invalid_data))
         assert "ERROR" in result or "required" in result.lower()
+    
+    def test_ml_batch_matches_single_prediction(self):
+        """Test that batched ML scoring agrees with per-applicant scoring"""
+        model = get_ml_model()
+        features_list = [
+            {"credit_score": 750, "age": 35, "claims_count": 1,
+             "coverage_amount_normalized": 0.1, "years_licensed": 15},
+            {"credit_score": 580, "age": 22, "claims_count": 4,
+             "coverage_amount_normalized": 0.9, "years_licensed": 1},
+        ]
+        
+        batch = model.predict_risk_batch(features_list)
+        
+        assert batch == [model.predict_risk(features) for features in features_list]
+    
+    def test_risk_score_batch_matches_single_score(self, varied_applicants):
+        """Test that batched risk scoring agrees exactly with per-applicant scoring"""
+        model = get_ml_model()
+        rule_results_list = [
+            UnderwritingRuleEngine.evaluate_rules(applicant, {}) for applicant in varied_applicants
+        ]
+        ml_results_list = [
+            model.predict_risk(UnderwritingTool._ml_features(applicant)) if i % 3 else {"ml_available": False}
+            for i, applicant in enumerate(varied_applicants)
+        ]
+        
+        batch = RiskCalculator.calculate_risk_score_batch(
+            varied_applicants, rule_results_list, ml_results_list
+        )
+        
+        assert batch.tolist() == [
+            RiskCalculator.calculate_risk_score(applicant, rule_results, ml_results)
+            for applicant, rule_results, ml_results in zip(
+                varied_applicants, rule_results_list, ml_results_list
+            )
+        ]
+    
+    def test_premium_batch_matches_single_premium(self, varied_applicants):
+        """Test that batched pricing agrees exactly with per-applicant pricing"""
+        rule_results_list = [
+            UnderwritingRuleEngine.evaluate_rules(applicant, {}) for applicant in varied_applicants
+        ]
+        # The ends of the range, each risk-level cut-off and the score just below it,
+        # plus a couple of interior scores
+        boundary_scores = (0, 29.99, 30, 49.99, 50, 69.99, 70, 100, 18.2727, 61.4545)
+        risk_scores = [
+            boundary_scores[i % len(boundary_scores)] for i in range(len(varied_applicants))
+        ]
+        
+        batch = RiskCalculator.calculate_premium_batch(
+            varied_applicants, risk_scores, [r["risk_codes"] for r in rule_results_list]
+        )
+        
+        assert batch == [
+            RiskCalculator.calculate_premium(applicant, risk_score, rule_results["risk_factors"])
+            for applicant, risk_score, rule_results in zip(
+                varied_applicants, risk_scores, rule_results_list
+            )
+        ]
+    
+    def test_classify_risk_batch_matches_decision_ladder(self, underwriting_tool, good_applicant_data):
+        """Test that array risk classification agrees with _make_decision, including the cut-offs"""
+        applicant = ApplicantData(**good_applicant_data)
+        rule_results = UnderwritingRuleEngine.evaluate_rules(applicant, {})
+        risk_scores = [0, 29.99, 30, 49.99, 50, 69.99, 70, 100]
+        
+        batch = RiskCalculator.classify_risk_batch(np.array(risk_scores))
+        
+        assert batch == [
+            underwriting_tool._make_decision(applicant, risk_score, rule_results, {}, {}).risk_level
+            for risk_score in risk_scores
+        ]
+        assert batch == [
+            RiskLevel.LOW, RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.MEDIUM,
+            RiskLevel.HIGH, RiskLevel.HIGH, RiskLevel.VERY_HIGH, RiskLevel.VERY_HIGH
+        ]
+    
+    def test_quantized_tree_matches_sklearn(self):
+        """Test the int16 tree walk against sklearn, which may differ only in coverage split buckets"""
+        model = get_ml_model()
+        rng = np.random.default_rng(7)
+        n = model.NUMBA_MIN_BATCH
+        X = np.column_stack([
+            rng.integers(300, 851, n),
+            rng.integers(18, 101, n),
+            rng.integers(0, 8, n),
+            rng.uniform(0, 1, n),
+            rng.integers(0, 60, n),
+        ]).astype(float)
+        # Put some coverage values inside the 0.800-0.804 bucket that holds the splits
+        X[:20, 3] = np.linspace(0.8, 0.8039, 20)
+        features_list = [dict(zip(model.FEATURE_ORDER, row)) for row in X.tolist()]
+        
+        tree = model.model.tree_
+        coverage_nodes = tree.feature == 3
+        coverage_splits = tree.threshold[coverage_nodes] * model.scaler.scale_[3] + model.scaler.mean_[3]
+        split_buckets = np.floor(coverage_splits * model.FEATURE_QUANT_SCALE[3])
+        in_split_bucket = np.isin(np.floor(X[:, 3] * model.FEATURE_QUANT_SCALE[3]), split_buckets)
+        expected = model.model.predict_proba(model.scaler.transform(X))
+        
+        # Small batches take the NumPy walk, large ones the compiled kernel
+        for size in (100, n):
+            results = model.predict_risk_batch(features_list[:size])
+            probabilities = np.array([list(r["probabilities"].values()) for r in results])
+            predictions = np.array([r["prediction"] for r in results])
+            away = ~in_split_bucket[:size]
+            
+            assert (probabilities[away] == expected[:size][away]).all()
+            assert (predictions[away] == model.model.classes_[expected[:size][away].argmax(axis=1)]).all()
+    
+    def test_enrich_batch_fans_out_lookups(self, good_applicant_data):
+        """Test concurrent external lookups keep order and skip DMV for non-auto"""
+        life_data = copy.deepcopy(good_applicant_data)
+        life_data.update(applicant_id="TEST-004", insurance_type="life", smoker=False)
+        applicants = [ApplicantData(**good_applicant_data), ApplicantData(**life_data)]
+        
+        results = asyncio.run(ExternalDataAPI.enrich_batch(applicants))
+        
+        assert len(results) == 2
+        (auto_credit, auto_dmv), (life_credit, life_dmv) = results
+        assert auto_credit["verified"] and life_credit["verified"]
+        assert auto_dmv["data_available"]
+        assert life_dmv is None
+    
+    def test_enrich_batch_reuses_cached_credit(self, good_applicant_data, monkeypatch):
+        """Test that a repeat applicant's credit check is served from the shared cache"""
+        bureau_calls = []
+        simulate = ExternalDataAPI._simulated_credit_results
+        monkeypatch.setattr(
+            ExternalDataAPI, "_simulated_credit_results",
+            lambda scores: bureau_calls.append(scores) or simulate(scores)
+        )
+        data = copy.deepcopy(good_applicant_data)
+        data.update(applicant_id="TEST-CACHE-001")
+        applicants = [ApplicantData(**data)]
+        
+        (first_credit, _), = asyncio.run(ExternalDataAPI.enrich_batch(applicants))
+        (second_credit, _), = asyncio.run(ExternalDataAPI.enrich_batch(applicants))
+        
+        assert len(bureau_calls) == 1
+        assert second_credit == first_credit
+        assert ExternalDataAPI.verify_credit_score("TEST-CACHE-001", data["credit_score"]) == first_credit
+        assert len(bureau_calls) == 1
+    
+    def test_enrich_batch_looks_up_duplicates_once(self, good_applicant_data, monkeypatch):
+        """Test that an applicant repeated within a batch is looked up only once"""
+        credit_calls, dmv_calls = [], []
+        simulate_credit = ExternalDataAPI._simulated_credit_results
+        simulate_driving = ExternalDataAPI._simulated_driving_results
+        monkeypatch.setattr(
+            ExternalDataAPI, "_simulated_credit_results",
+            lambda scores: credit_calls.append(len(scores)) or simulate_credit(scores)
+        )
+        monkeypatch.setattr(
+            ExternalDataAPI, "_simulated_driving_results",
+            lambda count: dmv_calls.append(count) or simulate_driving(count)
+        )
+        data = copy.deepcopy(good_applicant_data)
+        data.update(applicant_id="TEST-DUP-001")
+        applicants = [ApplicantData(**data)] * 3
+        
+        results = asyncio.run(ExternalDataAPI.enrich_batch(applicants))
+        
+        assert credit_calls == [1] and dmv_calls == [1]
+        assert len(results) == 3
+        assert results[0] == results[1] == results[2]
+        assert results[0][0] is not results[1][0]
+    
+    def test_enrich_batch_simulates_one_bulk_request(self, good_applicant_data, monkeypatch):
+        """Test that simulated batch lookups draw all variances in one call per source"""
+        credit_calls, dmv_calls = [], []
+        simulate_credit = ExternalDataAPI._simulated_credit_results
+        simulate_driving = ExternalDataAPI._simulated_driving_results
+        monkeypatch.setattr(
+            ExternalDataAPI, "_simulated_credit_results",
+            lambda scores: credit_calls.append(list(scores)) or simulate_credit(scores)
+        )
+        monkeypatch.setattr(
+            ExternalDataAPI, "_simulated_driving_results",
+            lambda count: dmv_calls.append(count) or simulate_driving(count)
+        )
+        applicants = []
+        for i, credit_score in enumerate((610, 700, 790)):
+            data = copy.deepcopy(good_applicant_data)
+            data.update(applicant_id=f"TEST-BULK-{i}", credit_score=credit_score)
+            applicants.append(ApplicantData(**data))
+        
+        results = asyncio.run(ExternalDataAPI.enrich_batch(applicants))
+        
+        assert credit_calls == [[610, 700, 790]] and dmv_calls == [3]
+        assert [credit["reported_score"] for credit, _ in results] == [610, 700, 790]
+        assert all(dmv["data_available"] for _, dmv in results)
+    
+    def test_rules_batch_matches_single_evaluation(self, good_applicant_data, high_risk_applicant_data):
+        """Test that batched rule evaluation agrees with per-applicant evaluation"""
+        dui_data = copy.deepcopy(good_applicant_data)
+        dui_data["driving_record"]["dui_history"] = True
+        life_data = copy.deepcopy(good_applicant_data)
+        life_data.update(insurance_type="life", smoker=True, annual_income=0)
+        applicants = [
+            ApplicantData(**data)
+            for data in (good_applicant_data, high_risk_applicant_data, dui_data, life_data)
+        ]
+        external_data_list = [
+            {},
+            {"credit_verified": True, "credit_data": {"actual_score": 540}},
+            {},
+            {},
+        ]
+        
+        batch = UnderwritingRuleEngine.evaluate_rules_batch(applicants, external_data_list)
+        
+        assert batch == [
+            UnderwritingRuleEngine.evaluate_rules(applicant, external_data)
+            for applicant, external_data in zip(applicants, external_data_list)
+        ]
+    
+    def test_batch_underwrite_reports_each_application(self, good_applicant_data):
+        """Test the vectorized batch path reports every application in order"""
+        dui_data = copy.deepcopy(good_applicant_data)
+        dui_data.update(applicant_id="TEST-005")
+        dui_data["driving_record"]["dui_history"] = True
+        
+        result = batch_underwrite(dumps_json([good_applicant_data, dui_data]))
+        
+        assert "Total Applications Processed: 2" in result
+        first, second = result.split("Application #2")
+        assert "Application #1" in first and "TEST-001" in first
+        assert "TEST-005" in second and "DECLINED" in second
+    
+    def test_batch_underwrite_iter_streams_in_order(self, good_applicant_data):
+        """Test the streamed batch yields header, one section per application in order, then footer"""
+        applications = []
+        for applicant_id in ("TEST-006", "TEST-007", "TEST-008"):
+            data = copy.deepcopy(good_applicant_data)
+            data.update(applicant_id=applicant_id)
+            applications.append(data)
+        
+        chunks = list(batch_underwrite_iter(dumps_json(applications)))
+        
+        assert len(chunks) == 5
+        assert "Total Applications Processed: 3" in chunks[0]
+        for number, (chunk, data) in enumerate(zip(chunks[1:-1], applications), 1):
+            assert chunk.startswith(f"\nApplication #{number}\n")
+            assert data["applicant_id"] in chunk
+        assert "BATCH PROCESSING COMPLETE" in chunks[-1]
 
 
 # ==================== Document Filling Tool Tests ====================
 
+@pytest.fixture(scope="class")
+def document_tool():
+    """Create DocumentFillingTool instance"""
+    return DocumentFillingTool()
+
+
+@pytest.fixture(scope="class")
+def valid_customer_data():
+    """Valid customer data"""
+    return {
+        "full_name": "John Smith",
+        "date_of_birth": "1985-06-15",
+        "email": "john@email.com",
+        "phone": "+1-555-123-4567",
+        "street_address": "123 Main St",
+        "city": "New York",
+        "state": "NY",
+        "zip_code": "10001"
+    }
+
+
+@pytest.fixture(scope="class")
+def valid_policy_data():
+    """Valid policy data"""
+    return {
+        "insurance_type": "Life Insurance",
+        "policy_term": 20,
+        "premium_amount": 150.00,
+        "payment_frequency": "monthly",
+        "effective_date": "2025-11-01"
+    }
+
+
+@pytest.fixture(scope="class")
+def valid_customer_json(valid_customer_data):
+    """Valid customer data serialized once per class"""
+    return dumps_json(valid_customer_data)
+
+
+@pytest.fixture(scope="class")
+def valid_policy_json(valid_policy_data):
+    """Valid policy data serialized once per class"""
+    return dumps_json(valid_policy_data)
+
+
 class TestDocumentFillingTool:
     """Test suite for DocumentFillingTool"""
     
-    @pytest.fixture
-    def document_tool(self):
-        """Create DocumentFillingTool instance"""
-        return DocumentFillingTool()
-    
-    @pytest.fixture
-    def valid_customer_data(self):
-        """Valid customer data"""
-        return {
-            "full_name": "John Smith",
-            "date_of_birth": "1985-06-15",
-            "email": "john@email.com",
-            "phone": "+1-555-123-4567",
-            "street_address": "123 Main St",
-            "city": "New York",
-            "state": "NY",
-            "zip_code": "10001"
-        }
-    
-    @pytest.fixture
-    def valid_policy_data(self):
-        """Valid policy data"""
-        return {
-            "insurance_type": "Life Insurance",
-            "policy_term": 20,
-            "premium_amount": 150.00,
-            "payment_frequency": "monthly",
-            "effective_date": "2025-11-01"
-        }
-    
-    def test_consent_form_generation(self, document_tool, valid_customer_data):
+    def test_consent_form_generation(self, document_tool, valid_customer_json):
         """Test consent form generation"""
         result = document_tool._run(
-            json.dumps(valid_customer_data),
+            valid_customer_json,
             "consent_form"
         )
         
@@ -272,16 +692,17 @@ class TestDocumentFillingTool:
         self,
         document_tool,
         valid_customer_data,
-        valid_policy_data
+        valid_policy_json
     ):
         """Test policy application generation"""
         # Add coverage_amount to customer data
-        valid_customer_data["coverage_amount"] = 500000
+        customer_data = copy.deepcopy(valid_customer_data)
+        customer_data["coverage_amount"] = 500000
         
         result = document_tool._run(
-            json.dumps(valid_customer_data),
+            dumps_json(customer_data),
             "policy_application",
-            json.dumps(valid_policy_data)
+            valid_policy_json
         )
         
         assert "DOCUMENT GENERATION REPORT" in result
@@ -296,35 +717,32 @@ class TestDocumentFillingTool:
         }
         
         result = document_tool._run(
-            json.dumps(incomplete_data),
+            dumps_json(incomplete_data),
             "consent_form"
         )
         
         assert "ERROR" in result or "Missing" in result
     
-    def test_file_generation(self, document_tool, valid_customer_data):
+    def test_file_generation(self, document_tool, valid_customer_json):
         """Test that PDF file is actually generated"""
         result = document_tool._run(
-            json.dumps(valid_customer_data),
+            valid_customer_json,
             "consent_form"
         )
         
         # Extract file path from result
-        if "File Path:" in result:
-            lines = result.split('\n')
-            for line in lines:
-                if "File Path:" in line:
-                    file_path = line.split("File Path:")[1].strip()
-                    # Check if file exists
-                    assert Path(file_path).exists()
-                    # Clean up
-                    Path(file_path).unlink()
-                    break
-    
-    def test_invalid_document_type(self, document_tool, valid_customer_data):
+        match = FILE_PATH_RE.search(result)
+        if match:
+            file_path = Path(match.group(1).strip())
+            # Check if file exists
+            assert file_path.exists()
+            # Clean up
+            file_path.unlink()
+    
+    def test_invalid_document_type(self, document_tool, valid_customer_json):
         """Test error for invalid document type"""
         result = document_tool._run(
-            json.dumps(valid_customer_data),
+            valid_customer_json,
             "invalid_type"
         )
         
@@ -354,7 +772,7 @@ class TestIntegration:
             }
         }
         
-        quote_result = quoting_tool._run(json.dumps(quote_data))
+        quote_result = quoting_tool._run(dumps_json(quote_data))
         assert "TOTAL MONTHLY PREMIUM:" in quote_result
         
         # Step 2: Underwriting
@@ -383,7 +801,7 @@ class TestIntegration:
             }
         }
         
-        uw_result = underwriting_tool._run(json.dumps(uw_data))
+        uw_result = underwriting_tool._run(dumps_json(uw_data))
         assert "[APPROVED]" in uw_result
         
         # Step 3: Document generation
@@ -400,7 +818,7 @@ class TestIntegration:
         }
         
         doc_result = document_tool._run(
-            json.dumps(doc_data),
+            dumps_json(doc_data),
             "consent_form"
         )
         assert "DOCUMENT GENERATION REPORT" in doc_result
@@ -408,20 +826,22 @@ class TestIntegration:
 
 # ==================== Pytest Configuration ====================
 
+TEMPLATES_DIR = Path("document_templates")
+
+
 @pytest.fixture(scope="session", autouse=True)
-def setup_test_environment():
+def setup_test_environment(tmp_path_factory):
     """Setup test environment"""
     # Create directories if they don't exist
-    Path("generated_documents").mkdir(exist_ok=True)
-    Path("document_templates").mkdir(exist_ok=True)
+    TEMPLATES_DIR.mkdir(exist_ok=True)
+    
+    # Write generated documents to a pytest-managed temporary directory
+    output_dir = PDFGenerator.OUTPUT_DIR
+    PDFGenerator.OUTPUT_DIR = tmp_path_factory.mktemp("generated_documents")
     
     yield
     
-    # Cleanup after tests
-    # Remove test-generated documents
-    doc_dir = Path("generated_documents")
-    for doc in doc_dir.glob("*TEST*"):
-        doc.unlink()
+    PDFGenerator.OUTPUT_DIR = output_dir
 
 
 if __name__ == "__main__":